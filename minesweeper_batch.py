@@ -0,0 +1,385 @@
+import numpy as np
+
+from minesweeper_corpus import CLICK
+from minesweeper_game import DIFFICULTY_LEVELS
+
+# Boards drawn at once by random_mines
+GENERATE_CHUNK = 4096
+
+
+def window_sum(cells):
+    """
+    Sum a stack of boards over the 3x3 window of every cell, the cell included.
+
+    The sum is separable: shifted adds along the columns, then along the rows.
+    Cells past the edge count as 0.
+
+    Args:
+        cells (numpy.ndarray): (boards, rows, cols) boolean or uint8 array.
+
+    Returns:
+        numpy.ndarray: (boards, rows, cols) uint8 array of window sums.
+    """
+    horizontal = cells.astype(np.uint8)
+    horizontal[:, :, 1:] += cells[:, :, :-1]
+    horizontal[:, :, :-1] += cells[:, :, 1:]
+
+    total = horizontal.copy()
+    total[:, 1:] += horizontal[:, :-1]
+    total[:, :-1] += horizontal[:, 1:]
+    return total
+
+
+def window_any(cells):
+    """
+    Dilate a stack of boards by the 3x3 window.
+
+    Args:
+        cells (numpy.ndarray): (boards, rows, cols) boolean array, or bit-packed
+            words from pack_boards.
+
+    Returns:
+        numpy.ndarray: Array of the same shape, set for cells with a set cell
+        in their window.
+    """
+    horizontal = cells.copy()
+    horizontal[:, :, 1:] |= cells[:, :, :-1]
+    horizontal[:, :, :-1] |= cells[:, :, 1:]
+
+    total = horizontal.copy()
+    total[:, 1:] |= horizontal[:, :-1]
+    total[:, :-1] |= horizontal[:, 1:]
+    return total
+
+
+def window_count(words):
+    """
+    Bit-sliced 3x3 window sum of bit-packed boards.
+
+    Args:
+        words (numpy.ndarray): (words, rows, cols) uint64 array from pack_boards.
+
+    Returns:
+        list: Four bit planes of the sums (0 to 9), least significant first.
+    """
+    left = np.zeros_like(words)
+    left[:, :, 1:] = words[:, :, :-1]
+    right = np.zeros_like(words)
+    right[:, :, :-1] = words[:, :, 1:]
+    horizontal = add_planes([left], add_planes([words], [right]))
+
+    up = [np.zeros_like(words) for _ in horizontal]
+    down = [np.zeros_like(words) for _ in horizontal]
+    for plane, above, below in zip(horizontal, up, down):
+        above[:, 1:] = plane[:, :-1]
+        below[:, :-1] = plane[:, 1:]
+    return add_planes(up, add_planes(horizontal, down))[:4]
+
+
+def add_planes(x, y):
+    """
+    Add two bit-sliced numbers with a ripple-carry adder.
+
+    Args:
+        x (list): Bit planes of the first number, least significant first.
+        y (list): Bit planes of the second number.
+
+    Returns:
+        list: Bit planes of the sum, one more than the longer operand.
+    """
+    if len(x) < len(y):
+        x, y = y, x
+    result = []
+    carry = None
+    for i, a in enumerate(x):
+        b = y[i] if i < len(y) else None
+        if b is None and carry is None:
+            result.append(a)
+            continue
+        if b is None:
+            b, carry = carry, None
+        partial = a ^ b
+        if carry is None:
+            result.append(partial)
+            carry = a & b
+        else:
+            result.append(partial ^ carry)
+            carry = (a & b) | (carry & partial)
+    result.append(carry if carry is not None else np.zeros_like(x[0]))
+    return result
+
+
+def equal_planes(x, y):
+    """
+    Bitwise equality of two bit-sliced numbers.
+
+    Args:
+        x (list): Bit planes of the first number, least significant first.
+        y (list): Bit planes of the second number.
+
+    Returns:
+        numpy.ndarray: Words with a bit set where the numbers are equal.
+    """
+    if len(x) < len(y):
+        x, y = y, x
+    equal = ~(x[0] ^ y[0])
+    for i in range(1, len(x)):
+        equal &= ~(x[i] ^ y[i]) if i < len(y) else ~x[i]
+    return equal
+
+
+def pack_boards(cells):
+    """
+    Pack a stack of boolean boards 64 to a word.
+
+    Bit b of word w at (row, col) is that cell of board 64 * w + b, so every
+    bitwise operation on the words handles 64 boards at once. The last word is
+    padded with empty boards.
+
+    Args:
+        cells (numpy.ndarray): (boards, rows, cols) boolean array.
+
+    Returns:
+        numpy.ndarray: (words, rows, cols) uint64 array.
+    """
+    boards, rows, cols = cells.shape
+    words = -(-boards // 64)
+    padded = np.zeros((words * 64, rows, cols), dtype=bool)
+    padded[:boards] = cells
+    packed = np.packbits(padded.reshape(words, 64, rows, cols), axis=1, bitorder='little')
+    packed = np.ascontiguousarray(packed.transpose(0, 2, 3, 1))
+    return packed.view('<u8').reshape(words, rows, cols).astype(np.uint64)
+
+
+def unpack_boards(words, boards):
+    """
+    Inverse of pack_boards.
+
+    Args:
+        words (numpy.ndarray): (words, rows, cols) uint64 array.
+        boards (int): Number of boards to keep.
+
+    Returns:
+        numpy.ndarray: (boards, rows, cols) boolean array.
+    """
+    count, rows, cols = words.shape
+    packed = np.ascontiguousarray(words.astype('<u8')).view(np.uint8)
+    packed = packed.reshape(count, rows, cols, 8).transpose(0, 3, 1, 2)
+    bits = np.unpackbits(packed, axis=1, bitorder='little')
+    return bits.reshape(count * 64, rows, cols)[:boards].astype(bool)
+
+
+def random_mines(rows, cols, num_mines, count, seed=0):
+    """
+    Draw a stack of random boards in one vectorized step, each with a safe first click.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines on each board.
+        count (int): Number of boards.
+        seed (int): Seed of the NumPy generator.
+
+    Returns:
+        tuple: (mines, clicks): a (count, rows, cols) boolean mine mask and a
+        (count, 2) array of first-click (row, col) positions.
+    """
+    rng = np.random.default_rng(seed)
+    clicks = np.stack([rng.integers(rows, size=count), rng.integers(cols, size=count)], axis=1)
+    mines = np.zeros((count, rows * cols), dtype=bool)
+
+    # Random key per cell; the keys of the safe 3x3 window are pushed past all
+    # others, and the num_mines smallest keys become mines. Boards are drawn a
+    # chunk at a time so the keys and their partition stay small
+    for start in range(0, count, GENERATE_CHUNK):
+        chunk_clicks = clicks[start:start + GENERATE_CHUNK]
+        keys = rng.random((len(chunk_clicks), rows, cols), dtype=np.float32)
+        near_row = np.abs(np.arange(rows)[None, :] - chunk_clicks[:, :1]) <= 1
+        near_col = np.abs(np.arange(cols)[None, :] - chunk_clicks[:, 1:]) <= 1
+        keys[near_row[:, :, None] & near_col[:, None, :]] = 2.0
+
+        positions = np.argpartition(keys.reshape(len(chunk_clicks), -1), num_mines - 1,
+                                    axis=1)[:, :num_mines]
+        np.put_along_axis(mines[start:start + GENERATE_CHUNK], positions, True, axis=1)
+    return mines.reshape(count, rows, cols), clicks
+
+
+def corpus_mines(corpus, start=0, stop=None):
+    """
+    Decode a run of corpus records into a stack of boards.
+
+    Args:
+        corpus (BoardCorpus): Open corpus.
+        start (int): First board number.
+        stop (int): Board number after the last one (default: the end).
+
+    Returns:
+        tuple: (mines, clicks) as returned by random_mines.
+    """
+    with corpus.records(start, stop) as view:
+        records = np.frombuffer(view, dtype=np.uint8).reshape(-1, corpus.record_size)
+        clicks = records[:, :CLICK.size].copy().view('<u2').astype(np.intp)
+        bits = np.unpackbits(records[:, CLICK.size:], axis=1,
+                             count=corpus.rows * corpus.cols, bitorder='little')
+    return bits.reshape(-1, corpus.rows, corpus.cols).astype(bool), clicks
+
+
+class BatchSolver:
+    """Single Point (SP) solver advancing a stack of boards in lockstep.
+
+    The boards share one shape and are held as (boards, rows, cols) arrays:
+    mine mask, neighbor counts, revealed and flagged. Each step applies both
+    SP rules of SinglePointSolver.apply_single_point_strategy to every frontier
+    cell of every board at once:
+
+    - a revealed cell with as many flagged neighbors as its count marks its
+      unknown neighbors safe;
+    - a revealed cell with as many unknown neighbors as mines left marks them
+      as mines.
+
+    While solving, the state is bit-packed 64 boards to a word (pack_boards).
+    Neighbor counts come from shifted copies of the words fed through
+    bit-sliced adders, so each word operation advances a cell on 64 boards.
+    An empty cell is its own safe source, so opening empty regions needs no
+    separate flood fill. Steps repeat until no board changes; words whose
+    boards all stopped changing are dropped from later steps. `steps` counts
+    the steps taken over all chunks.
+
+    SP deductions do not depend on the order they are made in, so every board
+    ends in the same state as with SinglePointSolver(game, use_subsets=False).
+    Requires NumPy.
+    """
+
+    def __init__(self, mines, clicks):
+        """
+        Args:
+            mines (numpy.ndarray): (boards, rows, cols) boolean mine mask.
+            clicks (numpy.ndarray): (boards, 2) first-click (row, col) positions,
+                each away from any mine.
+        """
+        self.mines = mines
+        self.counts = window_sum(mines)
+        boards = np.arange(len(mines))
+        self.revealed = np.zeros_like(mines)
+        self.revealed[boards, clicks[:, 0], clicks[:, 1]] = True
+        self.flagged = np.zeros_like(mines)
+        self.steps = 0
+
+    @classmethod
+    def random(cls, difficulty, count, seed=0):
+        """
+        Create a solver over random boards of a difficulty.
+
+        Args:
+            difficulty (str): Key of DIFFICULTY_LEVELS.
+            count (int): Number of boards.
+            seed (int): Seed of the NumPy generator.
+
+        Returns:
+            BatchSolver: The solver.
+        """
+        level = DIFFICULTY_LEVELS[difficulty]
+        return cls(*random_mines(level['rows'], level['cols'], level['mines'], count, seed))
+
+    @classmethod
+    def from_corpus(cls, corpus, start=0, stop=None):
+        """
+        Create a solver over a run of boards of a corpus.
+
+        Args:
+            corpus (BoardCorpus): Open corpus.
+            start (int): First board number.
+            stop (int): Board number after the last one (default: the end).
+
+        Returns:
+            BatchSolver: The solver.
+        """
+        return cls(*corpus_mines(corpus, start, stop))
+
+    @staticmethod
+    def step(revealed, flagged, counts):
+        """
+        Apply one round of SP deductions to bit-packed boards, in place.
+
+        Args:
+            revealed (numpy.ndarray): Packed revealed mask.
+            flagged (numpy.ndarray): Packed flag mask.
+            counts (list): Bit planes of the neighbor mine counts.
+
+        Returns:
+            numpy.ndarray: Boolean array, True for words with a board that
+            changed.
+        """
+        unknown = ~(revealed | flagged)
+        unknown_neighbors = window_count(unknown)
+        flagged_neighbors = window_count(flagged)
+
+        frontier = revealed & (unknown_neighbors[0] | unknown_neighbors[1] |
+                               unknown_neighbors[2] | unknown_neighbors[3])
+        safe_sources = frontier & equal_planes(flagged_neighbors, counts)
+        mine_sources = frontier & equal_planes(
+            add_planes(unknown_neighbors, flagged_neighbors), counts)
+
+        new_safe = unknown & window_any(safe_sources)
+        new_mines = unknown & window_any(mine_sources)
+
+        revealed |= new_safe
+        flagged |= new_mines
+        return (new_safe | new_mines).any(axis=(1, 2))
+
+    def solve(self, chunk_size=2048):
+        """
+        Run SP steps until no board changes.
+
+        Boards are solved one chunk at a time so that the working arrays stay
+        in the CPU cache.
+
+        Args:
+            chunk_size (int): Boards per chunk, rounded up to a multiple of 64.
+
+        Returns:
+            numpy.ndarray: Boolean array, True for each solved board.
+        """
+        boards = len(self.mines)
+        revealed = pack_boards(self.revealed)
+        flagged = pack_boards(self.flagged)
+        counts = [pack_boards(self.counts & (1 << bit) > 0) for bit in range(4)]
+
+        chunk_words = max(1, -(-chunk_size // 64))
+        for start in range(0, len(revealed), chunk_words):
+            self.solve_words(revealed[start:start + chunk_words],
+                             flagged[start:start + chunk_words],
+                             [plane[start:start + chunk_words] for plane in counts])
+
+        self.revealed = unpack_boards(revealed, boards)
+        self.flagged = unpack_boards(flagged, boards)
+        return self.solved()
+
+    def solve_words(self, revealed, flagged, counts):
+        """
+        Run SP steps on bit-packed boards until none of them changes.
+
+        Args:
+            revealed (numpy.ndarray): Packed revealed mask, updated in place.
+            flagged (numpy.ndarray): Packed flag mask, updated in place.
+            counts (list): Bit planes of the neighbor mine counts.
+        """
+        words = np.arange(len(revealed))
+        live_revealed, live_flagged = revealed.copy(), flagged.copy()
+        while words.size:
+            changed = self.step(live_revealed, live_flagged, counts)
+            self.steps += 1
+            if changed.all():
+                continue
+
+            # Write back the words that are done and compact the rest
+            done = ~changed
+            revealed[words[done]] = live_revealed[done]
+            flagged[words[done]] = live_flagged[done]
+            words = words[changed]
+            live_revealed, live_flagged = live_revealed[changed], live_flagged[changed]
+            counts = [plane[changed] for plane in counts]
+
+    def solved(self):
+        """numpy.ndarray: Boolean array, True for boards with every safe cell revealed."""
+        return (self.revealed | self.mines).all(axis=(1, 2))
@@ -0,0 +1,390 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from multiprocessing import Pool
+
+from minesweeper_corpus import BoardCorpus
+from minesweeper_game import DIFFICULTY_LEVELS, MinesweeperGame
+from minesweeper_log import MoveLog
+from minesweeper_solver import SinglePointSolver
+from minesweeper_stats import SolverStats, profile
+
+try:
+    from minesweeper_batch import BatchSolver
+except ImportError:  # NumPy is optional; only --batch needs it
+    BatchSolver = None
+
+# Corpora opened by this process, by path; each worker maps a file once
+corpora = {}
+
+
+def run_game(task):
+    """
+    Play one seeded headless game and time the solver.
+
+    Args:
+        task (tuple): (difficulty, seed, guess, stats, record, budget) tuple.
+
+    Returns:
+        tuple: (difficulty, solved, lost, solve time in milliseconds, guesses,
+        stats, log), where stats is a SolverStats.as_dict() or None and log is
+        the encoded MoveLog of the game or None.
+    """
+    difficulty, seed, guess, stats, record, budget = task
+
+    level = DIFFICULTY_LEVELS[difficulty]
+    game = MinesweeperGame(level['rows'], level['cols'], level['mines'], seed=seed)
+    game.reveal(game.rng.randrange(game.rows), game.rng.randrange(game.cols))
+
+    return time_solver(difficulty, game, guess, stats, record, budget)
+
+
+def run_corpus_game(task):
+    """
+    Play one board of a corpus and time the solver.
+
+    Only the path and board number cross the process boundary; the board is
+    read from the worker's own mapping of the file.
+
+    Args:
+        task (tuple): (corpus path, board number, guess, stats, record, budget)
+            tuple.
+
+    Returns:
+        tuple: Same as run_game, labelled with the corpus difficulty.
+    """
+    path, i, guess, stats, record, budget = task
+    corpus = corpora.get(path)
+    if corpus is None:
+        corpus = corpora[path] = BoardCorpus(path)
+    return time_solver(corpus.difficulty, corpus.game(i), guess, stats, record, budget)
+
+
+def time_solver(difficulty, game, guess, stats=False, record=False, budget=None):
+    """
+    Run the solver on a game whose first click is already revealed.
+
+    Args:
+        difficulty (str): Label reported with the result.
+        game (MinesweeperGame): Game to solve.
+        guess (bool): Let the solver guess when deduction stalls.
+        stats (bool): Collect solver counters and timers.
+        record (bool): Record the game's moves in a MoveLog.
+        budget (float): Time limit per move in seconds, see SinglePointSolver.
+
+    Returns:
+        tuple: Same as run_game.
+    """
+    log = MoveLog.start(game) if record else None
+    solver = SinglePointSolver(game, callback=log.record_move if record else None,
+                               guess=guess, stats=SolverStats() if stats else None,
+                               budget=budget)
+    start_time = time.perf_counter()
+    if record:
+        log.started = start_time
+    solved = solver.solve()
+    elapsed = (time.perf_counter() - start_time) * 1000
+
+    return (difficulty, solved, game.lost, elapsed, len(solver.guesses),
+            solver.stats.as_dict() if stats else None, log.to_bytes() if record else None)
+
+
+def percentile(values, fraction):
+    """
+    Nearest-rank percentile of a sorted list.
+
+    Args:
+        values (list): Sorted values.
+        fraction (float): Percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The percentile, or 0.0 for an empty list.
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(len(values) * fraction))
+    return values[rank - 1]
+
+
+def summarize(results):
+    """
+    Aggregate per-game results into per-difficulty statistics.
+
+    Args:
+        results (list): Tuples returned by run_game.
+
+    Returns:
+        dict: Statistics keyed by difficulty.
+    """
+    summary = {}
+    for difficulty in dict.fromkeys(result[0] for result in results):
+        games = [result for result in results if result[0] == difficulty]
+
+        wins = sum(1 for _, solved, *_ in games if solved)
+        losses = sum(1 for _, _, lost, *_ in games if lost)
+        stuck = len(games) - wins - losses
+        latencies = sorted(elapsed for _, _, _, elapsed, *_ in games)
+
+        summary[difficulty] = {
+            'games': len(games),
+            'wins': wins,
+            'losses': losses,
+            'stuck': stuck,
+            'win_rate': wins / len(games),
+            'stuck_rate': stuck / len(games),
+            'guesses_per_game': sum(guesses for _, _, _, _, guesses, *_ in games) / len(games),
+            'latency_ms': {
+                'mean': sum(latencies) / len(latencies),
+                'p50': percentile(latencies, 0.50),
+                'p95': percentile(latencies, 0.95),
+                'p99': percentile(latencies, 0.99),
+                'max': latencies[-1],
+            },
+        }
+
+        if games[0][5] is not None:
+            stats = SolverStats()
+            for _, _, _, _, _, game_stats, _ in games:
+                stats.merge(game_stats)
+            summary[difficulty]['stats'] = stats.as_dict()
+    return summary
+
+
+def write_recorded_logs(path, results):
+    """
+    Write the move logs recorded by the games of a run to one file.
+
+    Args:
+        path (str): Output file, readable with minesweeper_log.read_logs.
+        results (list): Tuples returned by run_game, in game order.
+    """
+    with open(path, 'wb') as f:
+        for *_, log in results:
+            f.write(log)
+
+
+def run_tasks(function, tasks, workers):
+    """
+    Map a task function over a process pool, or in-process for one worker.
+
+    Args:
+        function (callable): run_game or run_corpus_game.
+        tasks (list): Task tuples.
+        workers (int): Number of worker processes.
+
+    Returns:
+        tuple: (results, wall time in seconds).
+    """
+    start_time = time.perf_counter()
+    if workers == 1:
+        results = [function(task) for task in tasks]
+    else:
+        with Pool(workers) as pool:
+            results = pool.map(function, tasks,
+                               chunksize=max(1, len(tasks) // (workers * 4)))
+    return results, time.perf_counter() - start_time
+
+
+def run_benchmark(difficulties, games, seed=0, workers=None, guess=False, stats=False,
+                  record=None, budget=None):
+    """
+    Run seeded headless games for each difficulty across a process pool.
+
+    Game i of every difficulty uses seed `seed + i`, so runs with the same
+    arguments play the same boards.
+
+    Args:
+        difficulties (list): Keys of DIFFICULTY_LEVELS to benchmark.
+        games (int): Number of games per difficulty.
+        seed (int): Seed of the first game.
+        workers (int): Number of worker processes (default: CPU count).
+        guess (bool): Let the solver guess when deduction stalls.
+        stats (bool): Add the solver's summed counters and timers to the report.
+        record (str): Write the move log of every game to this file.
+        budget (float): Time limit per move in seconds (default: none).
+
+    Returns:
+        dict: JSON-serializable benchmark report.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = [(difficulty, seed + i, guess, stats, record is not None, budget)
+             for difficulty in difficulties for i in range(games)]
+    results, wall_time = run_tasks(run_game, tasks, workers)
+    if record is not None:
+        write_recorded_logs(record, results)
+
+    return {
+        'python': platform.python_version(),
+        'games_per_difficulty': games,
+        'seed': seed,
+        'workers': workers,
+        'guess': guess,
+        'budget_ms': None if budget is None else budget * 1000,
+        'wall_time_s': wall_time,
+        'results': summarize(results),
+    }
+
+
+def run_corpus_benchmark(path, games=None, workers=None, guess=False, stats=False,
+                         record=None, budget=None):
+    """
+    Run the boards of a corpus file across a process pool.
+
+    Workers map the file themselves, so boards are neither regenerated nor
+    pickled between processes.
+
+    Args:
+        path (str): Corpus file written by minesweeper_corpus.
+        games (int): Number of boards to play from the start (default: all).
+        workers (int): Number of worker processes (default: CPU count).
+        guess (bool): Let the solver guess when deduction stalls.
+        stats (bool): Add the solver's summed counters and timers to the report.
+        record (str): Write the move log of every game to this file.
+        budget (float): Time limit per move in seconds (default: none).
+
+    Returns:
+        dict: JSON-serializable benchmark report.
+    """
+    workers = workers or os.cpu_count() or 1
+    with BoardCorpus(path) as corpus:
+        count = len(corpus) if games is None else min(games, len(corpus))
+    tasks = [(path, i, guess, stats, record is not None, budget) for i in range(count)]
+    results, wall_time = run_tasks(run_corpus_game, tasks, workers)
+    if record is not None:
+        write_recorded_logs(record, results)
+
+    return {
+        'python': platform.python_version(),
+        'corpus': path,
+        'games': count,
+        'workers': workers,
+        'guess': guess,
+        'budget_ms': None if budget is None else budget * 1000,
+        'wall_time_s': wall_time,
+        'results': summarize(results),
+    }
+
+
+def run_batch_benchmark(difficulties, games, seed=0, corpus=None):
+    """
+    Measure the throughput of the batched SP solver.
+
+    The batch solver applies single-point rules only (no subset stage, no
+    guessing) to all boards of a difficulty at once, on one core.
+
+    Args:
+        difficulties (list): Keys of DIFFICULTY_LEVELS to benchmark.
+        games (int): Number of boards per difficulty (default with a corpus:
+            all of its boards).
+        seed (int): Seed of the board generator.
+        corpus (str): Solve the boards of this corpus file instead of
+            generating them; difficulties and seed are then ignored.
+
+    Returns:
+        dict: JSON-serializable benchmark report.
+    """
+    results = {}
+    if corpus is not None:
+        with BoardCorpus(corpus) as boards:
+            games = len(boards) if games is None else min(games, len(boards))
+            difficulties = [boards.difficulty]
+            solvers = [BatchSolver.from_corpus(boards, 0, games)]
+    else:
+        solvers = (BatchSolver.random(difficulty, games, seed) for difficulty in difficulties)
+
+    for difficulty, solver in zip(difficulties, solvers):
+        start_time = time.perf_counter()
+        wins = int(solver.solve().sum())
+        elapsed = time.perf_counter() - start_time
+
+        results[difficulty] = {
+            'games': games,
+            'wins': wins,
+            'win_rate': wins / games,
+            'steps': solver.steps,
+            'solve_time_s': elapsed,
+            'boards_per_second': games / elapsed,
+        }
+
+    report = {
+        'python': platform.python_version(),
+        'games_per_difficulty': games,
+    }
+    if corpus is not None:
+        report['corpus'] = corpus
+    else:
+        report['seed'] = seed
+    report['batch'] = True
+    report['results'] = results
+    return report
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the headless Minesweeper solver.")
+    parser.add_argument('-n', '--games', type=int, default=None,
+                        help="games per difficulty (default: 1000, or the whole corpus)")
+    parser.add_argument('-d', '--difficulty', action='append',
+                        choices=list(DIFFICULTY_LEVELS),
+                        help="difficulty to run, may be repeated (default: all)")
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help="seed of the first game (default: 0)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('-g', '--guess', action='store_true',
+                        help="guess the lowest-risk cell when deduction stalls")
+    parser.add_argument('-c', '--corpus',
+                        help="play the boards of this corpus file instead of "
+                             "generating them")
+    parser.add_argument('-b', '--batch', action='store_true',
+                        help="measure the throughput of the batched NumPy SP solver")
+    parser.add_argument('--budget', type=float, metavar='MS',
+                        help="time limit per move in milliseconds; costly tiers give up "
+                             "and guesses fall back to local estimates when it runs out")
+    parser.add_argument('--stats', action='store_true',
+                        help="add solver counters and stage timers to the report")
+    parser.add_argument('--record', metavar='PATH',
+                        help="write the move log of every game to PATH "
+                             "(replay it with minesweeper_log.py)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="run in-process under cProfile and write the profile to PATH")
+    parser.add_argument('-o', '--output',
+                        help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.batch and BatchSolver is None:
+        parser.error("--batch requires NumPy")
+    # The profiler only sees the current process
+    workers = 1 if args.profile else args.workers
+    budget = None if args.budget is None else args.budget / 1000
+
+    def benchmark():
+        if args.batch:
+            if args.corpus:
+                return run_batch_benchmark(None, args.games, corpus=args.corpus)
+            return run_batch_benchmark(args.difficulty or list(DIFFICULTY_LEVELS),
+                                       args.games or 1000, args.seed)
+        if args.corpus:
+            return run_corpus_benchmark(args.corpus, args.games, workers,
+                                        args.guess, args.stats, args.record, budget)
+        return run_benchmark(args.difficulty or list(DIFFICULTY_LEVELS),
+                             args.games or 1000, args.seed, workers, args.guess, args.stats,
+                             args.record, budget)
+
+    report = profile(args.profile, benchmark) if args.profile else benchmark()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import argparse
+import mmap
+import random
+import struct
+
+from minesweeper_game import (DIFFICULTY_LEVELS, MinesweeperGame, board_buffer_from_mask,
+                              pack_mines, place_mines)
+
+
+# File header: magic, format version, rows, cols, mines, number of boards
+HEADER = struct.Struct('<4sHHHIQ')
+MAGIC = b'MSBC'
+VERSION = 1
+
+# Per-board record prefix: first-click row and column, followed by the mask
+CLICK = struct.Struct('<HH')
+
+
+def mask_size(rows, cols):
+    """int: Bytes taken by the bit-packed mine mask of one board."""
+    return (rows * cols + 7) // 8
+
+
+def generate_record(rows, cols, num_mines, rng):
+    """
+    Generate one board as a corpus record.
+
+    The first click is drawn uniformly, then the mines are placed around it
+    exactly as a seeded MinesweeperGame would place them.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines on the board.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        bytes: The first-click position followed by the mine mask.
+    """
+    row = rng.randrange(rows)
+    col = rng.randrange(cols)
+    mines = place_mines(rows, cols, num_mines, row, col, rng)
+    return CLICK.pack(row, col) + pack_mines(rows, cols, mines)
+
+
+def write_corpus(path, rows, cols, num_mines, count, seed=0):
+    """
+    Generate a corpus of seeded boards and write it to a file.
+
+    Every record has the same size, so board i sits at a fixed offset and the
+    file can be sliced without parsing. The boards depend only on the shape,
+    the mine count and the seed.
+
+    Args:
+        path (str): Output file.
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines on each board.
+        count (int): Number of boards.
+        seed (int): Seed of the random.Random used for the whole corpus.
+    """
+    rng = random.Random(seed)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, cols, num_mines, count))
+        for _ in range(count):
+            f.write(generate_record(rows, cols, num_mines, rng))
+
+
+class BoardCorpus:
+    """Read-only, memory-mapped view of a board corpus file.
+
+    The file is mapped once and records are returned as memoryview slices of
+    the mapping, so nothing is copied until a board is expanded with board()
+    or game(). Processes that open the same file share its pages through the
+    OS page cache.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Corpus file written by write_corpus.
+
+        Raises:
+            ValueError: If the file is not a corpus or is truncated.
+        """
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.buffer)
+
+        if len(self.view) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a board corpus")
+        magic, version, self.rows, self.cols, self.num_mines, self.count = \
+            HEADER.unpack_from(self.view)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a board corpus")
+
+        self.mask_size = mask_size(self.rows, self.cols)
+        self.record_size = CLICK.size + self.mask_size
+        if len(self.view) < HEADER.size + self.count * self.record_size:
+            self.close()
+            raise ValueError(f"{path}: truncated board corpus")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the mapping. Slices returned earlier must be released first."""
+        self.view.release()
+        self.buffer.close()
+
+    @property
+    def difficulty(self):
+        """str: Key of DIFFICULTY_LEVELS matching the corpus, or 'ROWSxCOLS/MINES'."""
+        for name, level in DIFFICULTY_LEVELS.items():
+            if (level['rows'], level['cols'], level['mines']) == \
+                    (self.rows, self.cols, self.num_mines):
+                return name
+        return f"{self.rows}x{self.cols}/{self.num_mines}"
+
+    def record(self, i):
+        """
+        Zero-copy view of a board record.
+
+        Args:
+            i (int): Board number.
+
+        Returns:
+            tuple: (row, col, mask), the first click and a memoryview of the
+            bit-packed mine mask.
+        """
+        if not 0 <= i < self.count:
+            raise IndexError("board index out of range")
+        start = HEADER.size + i * self.record_size
+        row, col = CLICK.unpack_from(self.view, start)
+        return row, col, self.view[start + CLICK.size:start + self.record_size]
+
+    def records(self, start=0, stop=None):
+        """
+        Zero-copy view of a run of consecutive records.
+
+        Args:
+            start (int): First board number.
+            stop (int): Board number after the last one (default: the end).
+
+        Returns:
+            memoryview: The raw records, record_size bytes each.
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        return self.view[HEADER.size + start * self.record_size:
+                         HEADER.size + stop * self.record_size]
+
+    def board(self, i):
+        """
+        Expand a record into a flat board buffer.
+
+        Args:
+            i (int): Board number.
+
+        Returns:
+            tuple: (board, row, col), the buffer and the first click.
+        """
+        row, col, mask = self.record(i)
+        with mask:
+            return board_buffer_from_mask(self.rows, self.cols, mask), row, col
+
+    def game(self, i):
+        """
+        Start a game on a board of the corpus, with the first click revealed.
+
+        Args:
+            i (int): Board number.
+
+        Returns:
+            MinesweeperGame: The game.
+        """
+        board, row, col = self.board(i)
+        game = MinesweeperGame(self.rows, self.cols, self.num_mines)
+        game.load_board(board, row, col)
+        game.reveal(row, col)
+        return game
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Write a corpus of seeded Minesweeper boards.")
+    parser.add_argument('output', help="corpus file to write")
+    parser.add_argument('-d', '--difficulty', default='Expert',
+                        choices=list(DIFFICULTY_LEVELS),
+                        help="board size and mine count (default: Expert)")
+    parser.add_argument('-n', '--boards', type=int, default=1000,
+                        help="number of boards (default: 1000)")
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help="corpus seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    level = DIFFICULTY_LEVELS[args.difficulty]
+    write_corpus(args.output, level['rows'], level['cols'], level['mines'],
+                 args.boards, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,790 @@
+import copy
+import random
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; boards are then generated in pure Python
+    np = None
+
+
+# Value stored in the flat board buffer for a cell that contains a mine
+MINE_VALUE = 9
+
+DIFFICULTY_LEVELS = {'Beginner': {'rows': 9, 'cols': 9, 'mines': 10},
+                     'Intermediate': {'rows': 16, 'cols': 16, 'mines': 40},
+                     'Expert': {'rows': 16, 'cols': 30, 'mines': 99}}
+
+
+def create_mine_mask(rows, cols, num_mines, initial_click_row, initial_click_col,
+                     rng=random):
+    """Place mines with a single vectorized draw, keeping the first click safe.
+
+    Requires NumPy. The generator is seeded from `rng`, but NumPy does not
+    promise a stable sequence across versions, so seeded games use place_mines.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines to be placed on the game board.
+        initial_click_row (int): Row index of the initially clicked cell.
+        initial_click_col (int): Column index of the initially clicked cell.
+        rng (random.Random): Source of randomness (default: the random module).
+
+    Returns:
+        numpy.ndarray: (rows, cols) boolean array, True where a mine is placed.
+    """
+    # Exclude the initially clicked cell and its neighbors
+    safe = np.zeros((rows, cols), dtype=bool)
+    safe[max(0, initial_click_row - 1):initial_click_row + 2,
+         max(0, initial_click_col - 1):initial_click_col + 2] = True
+    possible_positions = np.flatnonzero(~safe)
+
+    generator = np.random.default_rng(rng.getrandbits(64))
+    mine_positions = possible_positions[
+        generator.choice(possible_positions.size, num_mines, replace=False)]
+
+    mask = np.zeros(rows * cols, dtype=bool)
+    mask[mine_positions] = True
+    return mask.reshape(rows, cols)
+
+
+def count_neighbor_mines(mask):
+    """Count the mines in the 3x3 window around every cell with shifted sums.
+
+    Args:
+        mask (numpy.ndarray): (rows, cols) boolean mine mask.
+
+    Returns:
+        numpy.ndarray: (rows, cols) int8 array of mine counts.
+    """
+    rows, cols = mask.shape
+    padded = np.pad(mask.astype(np.int8), 1)
+
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    for di in range(3):
+        for dj in range(3):
+            counts += padded[di:di + rows, dj:dj + cols]
+    return counts
+
+
+def create_board_array(rows, cols, num_mines, initial_click_row, initial_click_col,
+                       rng=random):
+    """Create a Minesweeper game board as a NumPy array.
+
+    Suited to large and custom boards: a 1000x1000 board takes a few
+    milliseconds. Requires NumPy.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines to be placed on the game board.
+        initial_click_row (int): Row index of the initially clicked cell.
+        initial_click_col (int): Column index of the initially clicked cell.
+        rng (random.Random): Source of randomness (default: the random module).
+
+    Returns:
+        numpy.ndarray: (rows, cols) int8 array of neighbor mine counts, with -1
+        marking mines.
+    """
+    mask = create_mine_mask(rows, cols, num_mines,
+                            initial_click_row, initial_click_col, rng)
+    board = count_neighbor_mines(mask)
+    board[mask] = -1
+    return board
+
+
+def place_mines(rows, cols, num_mines, initial_click_row, initial_click_col, rng=random):
+    """Pick random mine positions, keeping the first click and its neighbors safe.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines to be placed on the game board.
+        initial_click_row (int): Row index of the initially clicked cell.
+        initial_click_col (int): Column index of the initially clicked cell.
+        rng (random.Random): Source of randomness (default: the random module).
+
+    Returns:
+        list: Mine positions as row-major cell numbers, row * cols + col.
+    """
+    # Get all possible positions except the initially clicked cell and its neighbors
+    possible_positions = [i * cols + j for i in range(rows) for j in range(cols)
+                          if abs(i - initial_click_row) > 1 or abs(j - initial_click_col) > 1]
+
+    # Randomly place mines in the remaining positions
+    return rng.sample(possible_positions, num_mines)
+
+
+def create_board_buffer(rows, cols, num_mines, initial_click_row, initial_click_col,
+                        rng=random):
+    """Create a Minesweeper game board as a flat buffer with a one-cell border.
+
+    Cell (row, col) is stored at index (row + 1) * (cols + 2) + col + 1, which is
+    the layout used by MinesweeperGame.
+
+    Unseeded boards use the vectorized NumPy generator when NumPy is installed.
+    A seeded `rng` always goes through place_mines, so a seed gives the same
+    board with or without NumPy, and the same board as a corpus record.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines to be placed on the game board.
+        initial_click_row (int): Row index of the initially clicked cell.
+        initial_click_col (int): Column index of the initially clicked cell.
+        rng (random.Random): Source of randomness (default: the random module).
+
+    Returns:
+        bytearray: Neighbor mine counts, with MINE_VALUE marking mines and 0 on
+        the border.
+    """
+    if np is not None and rng is random:
+        padded = np.zeros((rows + 2, cols + 2), dtype=np.int8)
+        padded[1:-1, 1:-1] = create_board_array(rows, cols, num_mines,
+                                                initial_click_row, initial_click_col, rng)
+        padded[padded < 0] = MINE_VALUE
+        return bytearray(padded.tobytes())
+
+    return board_buffer_from_mines(rows, cols, place_mines(
+        rows, cols, num_mines, initial_click_row, initial_click_col, rng))
+
+
+def board_buffer_from_mines(rows, cols, mine_positions):
+    """Build the flat board buffer for known mine positions.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        mine_positions (iterable): Row-major cell numbers, row * cols + col, of
+            the mines.
+
+    Returns:
+        bytearray: Neighbor mine counts in the layout of create_board_buffer.
+    """
+    stride = cols + 2
+    offsets = neighbor_offsets(cols)
+    buffer = bytearray((rows + 2) * stride)
+
+    mines = [(position // cols + 1) * stride + position % cols + 1
+             for position in mine_positions]
+    for idx in mines:
+        for offset in offsets:
+            buffer[idx + offset] += 1
+    for idx in mines:
+        buffer[idx] = MINE_VALUE
+
+    # Counts spill onto the border; clear it
+    buffer[:stride] = bytes(stride)
+    buffer[-stride:] = bytes(stride)
+    buffer[::stride] = bytes(rows + 2)
+    buffer[stride - 1::stride] = bytes(rows + 2)
+    return buffer
+
+
+def board_buffer_from_mask(rows, cols, mask):
+    """Build the flat board buffer from a bit-packed mine mask.
+
+    Bit i of the mask (little-endian bit order within each byte) is set when
+    row-major cell i holds a mine.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        mask (bytes-like): At least (rows * cols + 7) // 8 bytes.
+
+    Returns:
+        bytearray: Neighbor mine counts in the layout of create_board_buffer.
+    """
+    if np is not None:
+        bits = np.unpackbits(np.frombuffer(mask, dtype=np.uint8),
+                             count=rows * cols, bitorder='little')
+        return board_buffer_from_mines(rows, cols, np.flatnonzero(bits).tolist())
+
+    bits = int.from_bytes(mask, 'little') & ((1 << rows * cols) - 1)
+    mine_positions = []
+    while bits:
+        lowest = bits & -bits
+        mine_positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return board_buffer_from_mines(rows, cols, mine_positions)
+
+
+def pack_mines(rows, cols, mine_positions):
+    """Bit-pack mine positions into the mask read by board_buffer_from_mask.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        mine_positions (iterable): Row-major cell numbers of the mines.
+
+    Returns:
+        bytes: (rows * cols + 7) // 8 bytes.
+    """
+    bits = 0
+    for position in mine_positions:
+        bits |= 1 << position
+    return bits.to_bytes((rows * cols + 7) // 8, 'little')
+
+
+@lru_cache(maxsize=None)
+def neighbor_offsets(cols):
+    """Offsets of the 3x3 window in the padded flat layout, the cell included.
+
+    Args:
+        cols (int): Number of columns in the game board.
+
+    Returns:
+        tuple: The nine index offsets.
+    """
+    stride = cols + 2
+    return tuple(di * stride + dj for di in (-1, 0, 1) for dj in (-1, 0, 1))
+
+
+@lru_cache(maxsize=None)
+def initial_buffers(rows, cols):
+    """Build the starting revealed and unrevealed-neighbor buffers for a shape.
+
+    Border cells count as revealed so that they never take part in the game.
+    Their unrevealed-neighbor count starts at 9 so that it never goes negative
+    as interior cells are revealed; it is never read.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+
+    Returns:
+        tuple: bytes of the revealed buffer and of the unrevealed-neighbor buffer.
+    """
+    stride = cols + 2
+    revealed = bytearray(b'\x01' * ((rows + 2) * stride))
+    unrevealed_neighbors = bytearray(b'\x09' * ((rows + 2) * stride))
+
+    # Size of the clipped window along each axis
+    col_span = [min(col + 1, cols - 1) - max(col - 1, 0) + 1 for col in range(cols)]
+    row_span = [min(row + 1, rows - 1) - max(row - 1, 0) + 1 for row in range(rows)]
+    patterns = {span: bytes(span * width for width in col_span)
+                for span in set(row_span)}
+
+    for row in range(rows):
+        start = (row + 1) * stride + 1
+        revealed[start:start + cols] = bytes(cols)
+        unrevealed_neighbors[start:start + cols] = patterns[row_span[row]]
+
+    return bytes(revealed), bytes(unrevealed_neighbors)
+
+
+class MinesweeperGame:
+    """Headless Minesweeper game state.
+
+    Holds the board together with the revealed and flagged cells and applies the
+    game rules. It has no dependency on Tkinter, so the same state can be driven
+    by the GUI, the solver or a batch script.
+
+    All cell state lives in flat bytearray buffers over the board padded with a
+    one-cell border: the 3x3 window of index `idx` is `idx + offset` for each of
+    the fixed `offsets`, with no bounds checks. Border cells count as revealed.
+    Methods taking (row, col) are for callers such as the GUI; the `*_index`
+    methods work on flat indices from `index()`.
+    """
+
+    def __init__(self, rows, cols, num_mines, seed=None):
+        """
+        Args:
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+            num_mines (int): Number of mines on the board.
+            seed (int): Seed for board generation. Successive games of a seeded
+                instance draw from one random.Random, so they are reproducible
+                as a sequence. By default the random module is used.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.num_mines = num_mines
+        self.rng = random if seed is None else random.Random(seed)
+        self.stride = cols + 2
+        self.offsets = neighbor_offsets(cols)
+        # Source of checkpoint tokens, never reused within a game object
+        self.checkpoint_serial = 0
+        self.reset()
+
+    def reset(self):
+        """Clear the board so that the next reveal starts a new game."""
+        revealed, unrevealed_neighbors = initial_buffers(self.rows, self.cols)
+        size = len(revealed)
+
+        self.board = None
+        self.revealed = bytearray(revealed)
+        self.flags = bytearray(size)
+        self.initial_click_row = None
+        self.initial_click_col = None
+        self.first_click = True
+        self.lost = False
+        # Undo journal while a checkpoint is open: lists of revealed cells,
+        # flat indices of toggled flags, and None for a loss
+        self.journal = None
+        # (token, journal length) of every open checkpoint, innermost last
+        self.checkpoints = []
+
+        # Running counters, kept up to date by reveal and toggle_flag
+        self.revealed_count = 0
+        self.flag_count = 0
+
+        # Per-cell counts over the 3x3 window, updated as deltas whenever a
+        # neighbor is revealed or flagged
+        self.unrevealed_neighbors = bytearray(unrevealed_neighbors)
+        self.flagged_neighbors = bytearray(size)
+
+    def copy(self):
+        """Return an independent copy of the game state.
+
+        The board is shared, since it never changes after it is generated; the
+        state buffers are copied.
+
+        Returns:
+            MinesweeperGame: The copy.
+        """
+        other = copy.copy(self)
+        other.journal = None
+        other.checkpoints = []
+        other.revealed = bytearray(self.revealed)
+        other.flags = bytearray(self.flags)
+        other.unrevealed_neighbors = bytearray(self.unrevealed_neighbors)
+        other.flagged_neighbors = bytearray(self.flagged_neighbors)
+        return other
+
+    @property
+    def safe_cells(self):
+        """int: Number of cells without a mine."""
+        return self.rows * self.cols - self.num_mines
+
+    @property
+    def mines_remaining(self):
+        """int: Mines left to flag, assuming every flag is correct."""
+        return self.num_mines - self.flag_count
+
+    @property
+    def unrevealed_count(self):
+        """int: Number of cells that are neither revealed nor flagged."""
+        return self.rows * self.cols - self.revealed_count - self.flag_count
+
+    def index(self, row, col):
+        """Flat buffer index of the specified cell."""
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, idx):
+        """(row, col) position of a flat buffer index."""
+        row, col = divmod(idx, self.stride)
+        return row - 1, col - 1
+
+    def indices(self):
+        """Iterate over the flat indices of all cells on the board, row by row."""
+        for row in range(self.rows):
+            start = (row + 1) * self.stride + 1
+            yield from range(start, start + self.cols)
+
+    def revealed_indices(self):
+        """Iterate over the flat indices of the revealed cells."""
+        revealed = self.revealed
+        return (idx for idx in self.indices() if revealed[idx])
+
+    def start(self, row, col):
+        """Generate the board around the first clicked cell.
+
+        Args:
+            row (int): Row index of the initially clicked cell.
+            col (int): Column index of the initially clicked cell.
+        """
+        self.initial_click_row = row
+        self.initial_click_col = col
+        self.board = create_board_buffer(self.rows, self.cols, self.num_mines,
+                                         row, col, self.rng)
+        self.first_click = False
+
+    def load_board(self, board, row, col):
+        """Start a game on a given board instead of generating one.
+
+        The first click is recorded but not revealed; call reveal(row, col) to
+        play it.
+
+        Args:
+            board (bytearray): Flat board buffer, e.g. from board_buffer_from_mask.
+            row (int): Row index of the first click.
+            col (int): Column index of the first click.
+        """
+        self.reset()
+        self.initial_click_row = row
+        self.initial_click_col = col
+        self.board = board
+        self.first_click = False
+
+    def neighbors(self, row, col):
+        """List the cells in the 3x3 window around the specified cell.
+
+        The window is clipped to the board and includes the cell itself.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            list: (row, col) tuples of the cells in the window.
+        """
+        return [(i, j)
+                for i in range(max(0, row - 1), min(self.rows, row + 2))
+                for j in range(max(0, col - 1), min(self.cols, col + 2))]
+
+    def is_revealed(self, row, col):
+        """bool: Whether the specified cell is revealed."""
+        return bool(self.revealed[self.index(row, col)])
+
+    def is_flagged(self, row, col):
+        """bool: Whether the specified cell is flagged."""
+        return bool(self.flags[self.index(row, col)])
+
+    def is_mine(self, row, col):
+        """bool: Whether the specified cell contains a mine."""
+        return self.board is not None and self.board[self.index(row, col)] == MINE_VALUE
+
+    def cell_value(self, row, col):
+        """int: Number of mines around the specified cell (MINE_VALUE for a mine)."""
+        return self.board[self.index(row, col)]
+
+    def reveal(self, row, col):
+        """Reveal the specified cell, opening the surrounding empty region.
+
+        The board is generated on the first reveal. Revealing a mine marks the
+        game as lost.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            list: (row, col) tuples of the newly revealed cells.
+        """
+        if self.first_click:
+            self.start(row, col)
+
+        return [self.position(idx) for idx in self.reveal_index(self.index(row, col))]
+
+    def reveal_index(self, idx):
+        """Reveal the cell at a flat index, opening the surrounding empty region.
+
+        Args:
+            idx (int): Flat index of the cell.
+
+        Returns:
+            list: Flat indices of the newly revealed cells.
+        """
+        if self.revealed[idx] or self.flags[idx]:
+            return []
+
+        if self.board[idx] == MINE_VALUE:
+            if self.journal is not None and not self.lost:
+                self.journal.append(None)
+            self.lost = True
+            return []
+
+        return self.reveal_empty_squares(idx)
+
+    def reveal_empty_squares(self, idx):
+        """Reveal a safe cell and, breadth-first, the empty region around it.
+
+        The flood fill is iterative and reads the precomputed counts stored on
+        the board, so large empty regions cost linear time and no recursion.
+        Flagged cells are left untouched.
+
+        Args:
+            idx (int): Flat index of a safe, unrevealed square.
+
+        Returns:
+            list: Flat indices of the newly revealed cells, in BFS order.
+        """
+        board, revealed, flags, offsets = self.board, self.revealed, self.flags, self.offsets
+
+        revealed[idx] = 1
+        opened = [idx]
+        queue = deque()
+        if board[idx] == 0:
+            queue.append(idx)
+
+        while queue:
+            current = queue.popleft()
+            for offset in offsets:
+                neighbor = current + offset
+                if not revealed[neighbor] and not flags[neighbor]:
+                    revealed[neighbor] = 1
+                    opened.append(neighbor)
+                    if board[neighbor] == 0:
+                        queue.append(neighbor)
+
+        unrevealed_neighbors = self.unrevealed_neighbors
+        for current in opened:
+            for offset in offsets:
+                unrevealed_neighbors[current + offset] -= 1
+
+        self.revealed_count += len(opened)
+        if self.journal is not None:
+            self.journal.append(opened)
+        return opened
+
+    def toggle_flag(self, row, col):
+        """Place or remove a flag on the specified cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            bool: True if the flag state changed, False if the cell is revealed.
+        """
+        return self.toggle_flag_index(self.index(row, col))
+
+    def toggle_flag_index(self, idx):
+        """Place or remove a flag on the cell at a flat index.
+
+        Args:
+            idx (int): Flat index of the cell.
+
+        Returns:
+            bool: True if the flag state changed, False if the cell is revealed.
+        """
+        if self.revealed[idx]:
+            return False
+
+        self.flags[idx] ^= 1
+        delta = 1 if self.flags[idx] else -1
+        self.flag_count += delta
+        flagged_neighbors = self.flagged_neighbors
+        for offset in self.offsets:
+            flagged_neighbors[idx + offset] += delta
+        if self.journal is not None:
+            self.journal.append(idx)
+        return True
+
+    def apply_move(self, action, row, col):
+        """Apply a move given by its action, as in a solver Move or a MoveLog.
+
+        Args:
+            action (str): 'reveal' or 'guess' to reveal the cell, 'flag' to
+                toggle its flag.
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            list: Flat indices of the newly revealed cells (empty for a flag).
+        """
+        idx = self.index(row, col)
+        if action == 'flag':
+            self.toggle_flag_index(idx)
+            return []
+        return self.reveal_index(idx)
+
+    def checkpoint(self):
+        """Mark the current state so that later changes can be rolled back.
+
+        Every reveal, flag and loss after a checkpoint is recorded in an undo
+        journal, so a what-if probe costs as much as its own changes rather
+        than a copy of the board.
+
+        Checkpoints nest: each one is a position in the same undo journal, and
+        each must be closed by exactly one rollback() or commit(), innermost
+        first. The journal stops when the last one is closed.
+
+        Returns:
+            int: Token for rollback() or commit().
+
+        Raises:
+            ValueError: Before the first click, since the board generated by it
+                cannot be undone.
+        """
+        if self.first_click:
+            raise ValueError("checkpoint() needs a started game")
+        if self.journal is None:
+            self.journal = []
+        self.checkpoint_serial += 1
+        self.checkpoints.append((self.checkpoint_serial, len(self.journal)))
+        return self.checkpoint_serial
+
+    def rollback(self, checkpoint):
+        """Undo every change made since a checkpoint.
+
+        Closes the checkpoint.
+
+        Args:
+            checkpoint (int): Token returned by checkpoint().
+
+        Raises:
+            ValueError: If the token is not the innermost open checkpoint.
+        """
+        length = self.innermost_checkpoint(checkpoint)
+        journal = self.journal
+        revealed, flags = self.revealed, self.flags
+        unrevealed_neighbors, flagged_neighbors = self.unrevealed_neighbors, self.flagged_neighbors
+        offsets = self.offsets
+
+        while len(journal) > length:
+            entry = journal.pop()
+            if entry is None:
+                self.lost = False
+            elif isinstance(entry, int):
+                flags[entry] ^= 1
+                delta = 1 if flags[entry] else -1
+                self.flag_count += delta
+                for offset in offsets:
+                    flagged_neighbors[entry + offset] += delta
+            else:
+                for idx in entry:
+                    revealed[idx] = 0
+                    for offset in offsets:
+                        unrevealed_neighbors[idx + offset] += 1
+                self.revealed_count -= len(entry)
+
+        self.close_checkpoint()
+
+    def commit(self, checkpoint):
+        """Keep the changes made since a checkpoint.
+
+        They stay in the journal, so an enclosing checkpoint can still roll
+        them back. Closes the checkpoint.
+
+        Args:
+            checkpoint (int): Token returned by checkpoint().
+
+        Raises:
+            ValueError: If the token is not the innermost open checkpoint.
+        """
+        self.innermost_checkpoint(checkpoint)
+        self.close_checkpoint()
+
+    def innermost_checkpoint(self, checkpoint):
+        """Check that a token is the innermost open checkpoint.
+
+        Args:
+            checkpoint (int): Token returned by checkpoint().
+
+        Returns:
+            int: Length of the journal when the checkpoint was taken.
+
+        Raises:
+            ValueError: If the token is not the innermost open checkpoint.
+        """
+        if not self.checkpoints or self.checkpoints[-1][0] != checkpoint:
+            raise ValueError("{!r} is not the innermost open checkpoint".format(checkpoint))
+        return self.checkpoints[-1][1]
+
+    def close_checkpoint(self):
+        """Close the innermost checkpoint, stopping the journal after the last."""
+        self.checkpoints.pop()
+        if not self.checkpoints:
+            self.journal = None
+
+    @contextmanager
+    def trial(self):
+        """Context manager that rolls back every change made in its block.
+
+        Yields:
+            MinesweeperGame: This game.
+        """
+        checkpoint = self.checkpoint()
+        try:
+            yield self
+        finally:
+            self.rollback(checkpoint)
+
+    def count_unrevealed_neighbors(self, row, col):
+        """
+        Count the number of unrevealed neighbors around the specified cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            int: Number of unrevealed neighbors.
+        """
+        return self.unrevealed_neighbors[self.index(row, col)]
+
+    def count_flagged_neighbors(self, row, col):
+        """
+        Count the number of flagged neighbors around the specified cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            int: Number of flagged neighbors.
+        """
+        return self.flagged_neighbors[self.index(row, col)]
+
+    def has_unprobed_neighbors(self, row, col):
+        """
+        Check if there are unprobed neighbors around the specified cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+
+        Returns:
+            bool: True if there are unprobed neighbors, False otherwise.
+        """
+        idx = self.index(row, col)
+        return self.unrevealed_neighbors[idx] > self.flagged_neighbors[idx]
+
+    def check_win(self):
+        """Check if the player has won the game.
+
+        The game is won once every safe cell is revealed, which the running
+        counter answers in constant time.
+
+        Returns:
+            bool: True if the player has won, False otherwise.
+        """
+        return not self.lost and self.revealed_count == self.safe_cells
+
+    def snapshot(self):
+        """Take an immutable copy of the revealed and flagged state.
+
+        Returns:
+            tuple: bytes of the revealed buffer and of the flags buffer.
+        """
+        return bytes(self.revealed), bytes(self.flags)
+
+    def changed_cells(self, snapshot):
+        """List the cells whose revealed or flagged state differs from a snapshot.
+
+        The buffers are compared as big integers, so the cost is a few bitwise
+        operations per changed cell rather than a walk over the board.
+
+        Args:
+            snapshot (tuple): Value returned by snapshot().
+
+        Returns:
+            list: (row, col) tuples of the changed cells, in board order.
+        """
+        old_revealed, old_flags = snapshot
+        diff = (int.from_bytes(old_revealed, 'little') ^ int.from_bytes(self.revealed, 'little')) | \
+            (int.from_bytes(old_flags, 'little') ^ int.from_bytes(self.flags, 'little'))
+
+        changed = []
+        while diff:
+            idx = ((diff & -diff).bit_length() - 1) >> 3
+            changed.append(self.position(idx))
+            diff &= ~(0xFF << (idx << 3))
+        return changed
+
+    def mine_positions(self):
+        """List the positions of all mines on the board.
+
+        Returns:
+            list: (row, col) tuples of the mines, empty before the first reveal.
+        """
+        if self.board is None:
+            return []
+
+        board = self.board
+        return [self.position(idx) for idx in self.indices() if board[idx] == MINE_VALUE]
@@ -1,554 +1,693 @@
-import tkinter as tk
-from tkinter import messagebox
-import random
-import time
-
-
-def create_board(rows, cols, num_mines, initial_click_row, initial_click_col):
-    """Create a Minesweeper game board with randomly placed mines, ensuring a safe initial click.
-
-    Args:
-        rows (int): Number of rows in the game board.
-        cols (int): Number of columns in the game board.
-        num_mines (int): Number of mines to be placed on the game board.
-        initial_click_row (int): Row index of the initially clicked cell.
-        initial_click_col (int): Column index of the initially clicked cell.
-
-    Returns:
-        list: 2D list representing the Minesweeper game board.
-    """
-    board = [[0 for _ in range(cols)] for _ in range(rows)]
-
-    # Get all possible positions except the initially clicked cell and its neighbors
-    possible_positions = [(i, j) for i in range(rows) for j in range(cols)
-                          if abs(i - initial_click_row) > 1 or abs(j - initial_click_col) > 1]
-
-    # Randomly place mines in the remaining positions
-    mine_positions = random.sample(possible_positions, num_mines)
-
-    for position in mine_positions:
-        row, col = position
-        # Use a character or value to represent mines (e.g., '*')
-        board[row][col] = '*'
-
-    # Update values in neighboring cells
-    for i in range(rows):
-        for j in range(cols):
-            if board[i][j] == '*':
-                continue  # Skip mines
-
-            # Count mines in neighboring cells
-            mine_count = sum(1 for x in range(max(0, i - 1), min(rows, i + 2))
-                             for y in range(max(0, j - 1), min(cols, j + 2))
-                             if board[x][y] == '*')
-
-            board[i][j] = mine_count
-
-    return board
-
-
-class MinesweeperGUI:
-    """Minesweeper GUI."""
-
-    DIFFICULTY_LEVELS = {'Beginner': {'rows': 9, 'cols': 9, 'mines': 10},
-                         'Intermediate': {'rows': 16, 'cols': 16, 'mines': 40},
-                         'Expert': {'rows': 16, 'cols': 30, 'mines': 99}}
-
-    def __init__(self, master, rows, cols, num_mines):
-        self.master = master
-        self.rows = rows
-        self.cols = cols
-        self.num_mines = num_mines
-        self.board = None
-        self.revealed = [[False for _ in range(cols)] for _ in range(rows)]
-        self.flags = [[False for _ in range(cols)] for _ in range(rows)]
-        self.unprobed_color = "#E0E0E0"
-        self.initial_click_row = None
-        self.initial_click_col = None
-        self.first_click = True
-        self.iteration = 0
-        self.solver = False
-
-        self.create_widgets()
-
-        solve_button = tk.Button(
-            self.master, text='Solve', command=self.activate_solver)
-        restart_button = tk.Button(
-            self.master, text="Restart", command=self.restart_game)
-
-    def create_widgets(self):
-        """Create GUI widgets for the Minesweeper game."""
-        self.buttons = [[None for _ in range(self.cols)]
-                        for _ in range(self.rows)]
-
-        for row in range(self.rows):
-            for col in range(self.cols):
-                button = tk.Button(self.master, text='', width=4, height=2, font=('Arial', 10),
-                                   command=lambda r=row, c=col: self.click_square(r, c))
-
-                button.configure(bg=self.unprobed_color, fg='black')
-
-                button.grid(row=row, column=col, padx=2, pady=2)
-                button.bind('<Button-3>', lambda event, r=row,
-                            c=col: self.right_click_square(r, c))
-                self.buttons[row][col] = button
-
-        # Difficulty change button
-        change_difficulty_button = tk.Button(
-            self.master, text='Change Difficulty', command=self.show_difficulty_menu)
-        change_difficulty_button.grid(
-            row=0, column=self.cols, padx=10, pady=10, sticky='w')
-
-        # Solving button
-        solve_button = tk.Button(
-            self.master, text='Solve', command=self.activate_solver)
-        solve_button.grid(row=1, column=self.cols,
-                          padx=10, pady=10, sticky='w')
-
-        # Restart button
-        restart_button = tk.Button(
-            self.master, text="Restart", command=self.restart_game)
-        restart_button.grid(row=3, column=self.cols,
-                            padx=10, pady=10, sticky='w')
-
-    def show_difficulty_menu(self):
-        """Show a menu to select difficulty level."""
-        difficulty_menu = tk.Toplevel(self.master)
-        difficulty_menu.title("Choose Difficulty")
-
-        for difficulty, config in self.DIFFICULTY_LEVELS.items():
-            button = tk.Button(difficulty_menu, text=difficulty.capitalize(),
-                               command=lambda d=difficulty: self.change_difficulty(d))
-            button.pack(pady=5)
-
-    def change_difficulty(self, difficulty):
-        """Change the difficulty level and reset the game."""
-        if difficulty in self.DIFFICULTY_LEVELS:
-            self.rows = self.DIFFICULTY_LEVELS[difficulty]['rows']
-            self.cols = self.DIFFICULTY_LEVELS[difficulty]['cols']
-            self.num_mines = self.DIFFICULTY_LEVELS[difficulty]['mines']
-
-            self.master.destroy()  # Close the current window
-
-            # Start a new game with the updated difficulty level
-            root = tk.Tk()
-            root.title("Minesweeper")
-            game = MinesweeperGUI(root, self.rows, self.cols, self.num_mines)
-            root.mainloop()
-        else:
-            messagebox.showwarning("Invalid Difficulty",
-                                   "Please enter a valid difficulty level.")
-
-    def click_square(self, row, col):
-        """Handle a left-click on the specified square.
-
-        Args:
-            row (int): Row index of the square.
-            col (int): Column index of the square.
-        """
-        if self.first_click:
-            # Dynamically assign initial_click_row and initial_click_col on the first click
-            self.initial_click_row = row
-            self.initial_click_col = col
-
-            # Use the modified create_board function with initial_click_row and initial_click_col
-            self.board = create_board(self.rows, self.cols, self.num_mines,
-                                      self.initial_click_row, self.initial_click_col)
-
-            self.first_click = False
-
-        if not self.revealed[row][col] and not self.flags[row][col]:
-            if self.board[row][col] == '*':
-                self.game_lose()
-            else:
-                mines_nearby = self.count_adjacent_mines(row, col)
-                self.revealed[row][col] = True
-                self.buttons[row][col].config(text=str(mines_nearby))
-
-                # Set the background color for probed cells
-                color = self.get_cell_color(mines_nearby)
-                self.buttons[row][col].config(
-                    state='normal', bg=color, fg='black')
-
-                if mines_nearby == 0:
-                    self.reveal_empty_squares(row, col)
-
-                if self.check_win() and self.solver == False:
-                    self.game_win()
-                    return
-
-    def right_click_square(self, row, col):
-        """Handle a right-click on the specified square.
-
-        Args:
-            row (int): Row index of the square.
-            col (int): Column index of the square.
-        """
-        if not self.revealed[row][col]:
-            self.flags[row][col] = not self.flags[row][col]
-            self.update_button_text(row, col)
-
-    def reveal_cell(self, row, col):
-        """Reveal the specified cell on the game board.
-
-        Args:
-            row (int): Row index of the cell.
-            col (int): Column index of the cell.
-        """
-        if not self.revealed[row][col] and not self.flags[row][col]:
-            if self.board[row][col] == '*':
-                self.game_lose = True
-            else:
-                mines_nearby = self.count_adjacent_mines(row, col)
-                self.revealed[row][col] = True
-
-                if mines_nearby == 0:
-                    self.reveal_empty_squares(row, col)
-
-                if self.check_win():
-                    self.game_win = True
-
-    def count_adjacent_mines(self, row, col):
-        """Count the number of mines adjacent to the specified square.
-
-        Args:
-            row (int): Row index of the square.
-            col (int): Column index of the square.
-
-        Returns:
-            int: Number of adjacent mines.
-        """
-        count = 0
-        rows, cols = self.rows, self.cols
-
-        for i in range(max(0, row - 1), min(rows, row + 2)):
-            for j in range(max(0, col - 1), min(cols, col + 2)):
-                if self.board[i][j] == '*':
-                    count += 1
-
-        return count
-
-    def reveal_empty_squares(self, row, col):
-        """Reveal empty squares recursively starting from the specified square.
-
-        Args:
-            row (int): Row index of the square.
-            col (int): Column index of the square.
-        """
-        for i in range(max(0, row - 1), min(self.rows, row + 2)):
-            for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                if not self.revealed[i][j]:
-                    self.click_square(i, j)
-
-    def update_button_text(self, row, col):
-        """Update the text and background color of the specified square.
-
-        Args:
-            row (int): Row index of the square.
-            col (int): Column index of the square.
-        """
-        if self.flags[row][col]:
-            self.buttons[row][col].config(text='🚩', bg='#3BD76A', fg='black')
-        else:
-            self.buttons[row][col].config(text='', bg=self.unprobed_color)
-
-    def get_cell_color(self, value):
-        """Determine the background color for a cell based on its value.
-
-        Args:
-            value: Value of the cell.
-
-        Returns:
-            str: Hexadecimal color code.
-        """
-        low_intensity_color = "#FFE3AF"  # Color for low intensity
-        high_intensity_color = "#3853FF"  # Color for high intensity
-
-        value_range = 8
-        factor = value / value_range
-
-        r_low, g_low, b_low = tuple(
-            int(low_intensity_color[i:i+2], 16) for i in (1, 3, 5))
-        r_high, g_high, b_high = tuple(
-            int(high_intensity_color[i:i+2], 16) for i in (1, 3, 5))
-
-        r = int(r_low + factor * (r_high - r_low))
-        g = int(g_low + factor * (g_high - g_low))
-        b = int(b_low + factor * (b_high - b_low))
-
-        color = "#{:02x}{:02x}{:02x}".format(r, g, b)
-
-        return color
-
-    def check_win(self):
-        """Check if the player has won the game.
-
-        Returns:
-            bool: True if the player has won, False otherwise.
-        """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if not self.revealed[row][col] and self.board[row][col] != '*':
-                    return False
-        return True
-
-    def show_mines(self):
-        """Reveal all mines on the game board."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] == '*':
-                    self.buttons[row][col].config(
-                        text='💣', state='disabled', bg='#2B2B2B')
-
-    def game_lose(self):
-        """Handle the end of the game when the player hits a mine."""
-        self.show_mines()
-        messagebox.showinfo("Game Over", "You hit a mine!")
-        return True
-
-    def game_win(self):
-        """Handle the end of the game when the player wins."""
-        self.show_mines()
-        messagebox.showinfo(
-            "You Win!", "Congratulations! You've probed every non-mine containing cell.")
-        return True
-
-    def restart_game(self):
-        """
-        Resets all game attributes and creates a new board.
-        """
-        # Reset revealed and flagged states
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.revealed[i][j] = False
-                self.flags[i][j] = False
-
-        # Reset game state and create new board
-        self.first_click = True
-        self.board = None
-        self.initial_click_row = None
-        self.initial_click_col = None
-        self.iteration = 0
-
-        # Update button appearance and state
-        for row in range(self.rows):
-            for col in range(self.cols):
-                self.buttons[row][col].config(
-                    text="", bg=self.unprobed_color, state="normal")
-
-    def count_unrevealed_neighbors(self, row, col):
-        """
-        Count the number of unrevealed neighbors around the specified cell.
-
-        Args:
-            row (int): Row index of the cell.
-            col (int): Column index of the cell.
-
-        Returns:
-            int: Number of unrevealed neighbors.
-        """
-        count = 0
-        for i in range(max(0, row - 1), min(self.rows, row + 2)):
-            for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                if not self.revealed[i][j]:
-                    count += 1
-
-        return count
-
-    def count_flagged_neighbors(self, row, col):
-        """
-        Count the number of flagged neighbors around the specified cell.
-
-        Args:
-            row (int): Row index of the cell.
-            col (int): Column index of the cell.
-
-        Returns:
-            int: Number of flagged neighbors.
-        """
-        count = 0
-        for i in range(max(0, row - 1), min(self.rows, row + 2)):
-            for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                if self.flags[i][j]:
-                    count += 1
-
-        return count
-
-    def has_unprobed_neighbors(self, row, col):
-        """
-        Check if there are unprobed neighbors around the specified cell.
-
-        Args:
-            row (int): Row index of the cell.
-            col (int): Column index of the cell.
-
-        Returns:
-            bool: True if there are unprobed neighbors, False otherwise.
-        """
-        for i in range(max(0, row - 1), min(self.rows, row + 2)):
-            for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                if not self.revealed[i][j] and not self.flags[i][j]:
-                    return True
-        return False
-
-    def activate_solver(self):
-        """
-        Activate the solve_game method
-        """
-        self.iteration = 0
-        self.solver = True
-        self.solve_game()
-
-    def solve_game(self):
-        """
-        Solve the game using the Single Point (SP) strategy
-
-        This function iterates through all unrevealed cells and applies SP strategy.
-        """
-        stop_traversal = False
-
-        while not stop_traversal and self.iteration < 2:
-            # Store the current state of the board
-            prev_board_state = [row[:] for row in self.revealed]
-
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    if self.revealed[row][col] and self.board[row][col] > 0 and self.has_unprobed_neighbors(row, col):
-                        # Highlight the current cell
-                        # self.buttons[row][col].config(bg='#FFCCE2')
-                        self.master.update()
-                        time.sleep(0)
-
-                        # Check if the clicked cell is a mine
-                        if self.board[row][col] == '*':
-                            self.game_lose()
-
-                        # Apply SP strategy
-                        self.apply_single_point_strategy(row, col)
-
-                        # Reset the color of the cell
-                        # self.buttons[row][col].config(bg=self.unprobed_color)
-                        self.master.update()
-
-                    if stop_traversal:
-                        break
-
-            # Check for changes in the board state
-            current_board_state = [row[:] for row in self.revealed]
-            if current_board_state == prev_board_state:
-                self.iteration += 1
-
-        # Check for win conditions after solving
-        if self.check_win():
-            stop_traversal
-            messagebox.showinfo(
-                "Win!", "Hooray, I solved the puzzle! ╰( ⁀‿⁀ )╯")
-            return
-        else:
-            stop_traversal
-            messagebox.showinfo(
-                "Solver Stopped", "Sorry, couldn't solve the whole puzzle (っ˘̩╭╮˘̩)っ")
-            return
-
-    def apply_single_point_strategy(self, row, col):
-        """
-        Apply the Single Point (SP) strategy to the specified cell
-
-        Args:
-            row (int): Row index of the cell.
-            col (int): Column index of the cell.
-        """
-        unrevealed_neighbors = self.count_unrevealed_neighbors(row, col)
-        flagged_neighbors = self.count_flagged_neighbors(row, col)
-        cell_value = int(self.board[row][col]
-                         ) if self.revealed[row][col] else 0
-        remaining_unrevealed_neighbors = unrevealed_neighbors - flagged_neighbors
-
-        # Scenario 1: Deduce safe cells
-        if flagged_neighbors == cell_value:
-            # All unrevealed neighbors are safe to reveal
-            for i in range(max(0, row - 1), min(self.rows, row + 2)):
-                for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                    if not self.revealed[i][j] and not self.flags[i][j]:
-                        self.click_square(i, j)
-
-        # Scenario 2: Deduce and flag mines
-        elif remaining_unrevealed_neighbors == cell_value - flagged_neighbors:
-            # If the number of remaining mines equals the number of unrevealed neighbors,
-            # flag all unrevealed neighbors as mines.
-            for i in range(max(0, row - 1), min(self.rows, row + 2)):
-                for j in range(max(0, col - 1), min(self.cols, col + 2)):
-                    if not self.revealed[i][j] and not self.flags[i][j]:
-                        self.right_click_square(i, j)
-
-    def solve_game_time(self):
-        """
-        Solve the game using the Single Point (SP) strategy (for tracking time)
-
-        This function iterates through all unrevealed cells and applies SP strategy.
-        """
-        total_time = 0.0
-        stop_traversal = False
-
-        start_time = time.time()
-        while not stop_traversal and self.iteration < 2:
-            # Store the current state of the board
-            prev_board_state = [row[:] for row in self.revealed]
-
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    if self.revealed[row][col] and self.board[row][col] > 0 and self.has_unprobed_neighbors(row, col):
-                        # Highlight the current cell
-                        # self.buttons[row][col].config(bg='#FFCCE2')
-                        self.master.update()
-                        time.sleep(0)
-
-                        # Check if the clicked cell is a mine
-                        if self.board[row][col] == '*':
-                            self.game_lose()
-
-                        # Apply SP strategy
-                        self.apply_single_point_strategy(row, col)
-
-                        # Reset the color of the cell
-                        # self.buttons[row][col].config(bg=self.unprobed_color)
-                        self.master.update()
-
-                    if stop_traversal:
-                        break
-
-            # Check for changes in the board state
-            current_board_state = [row[:] for row in self.revealed]
-            if current_board_state == prev_board_state:
-                self.iteration += 1
-
-        end_time = time.time()
-        elapsed_time = (end_time - start_time) * 1000
-        total_time += elapsed_time
-
-        # Check for win conditions after solving
-        if self.check_win():
-            stop_traversal
-            print(total_time)
-            self.master.destroy()
-        else:
-            stop_traversal
-            print(total_time)
-            self.master.destroy()
-
-    def activate_first_click(self):
-        """
-        Randomly choose first click on the grid and start the game.
-        """
-        self.iteration = 0
-        self.solver = True
-
-        # Randomly select a cell to click
-        initial_click_row = random.randint(0, self.rows - 1)
-        initial_click_col = random.randint(0, self.cols - 1)
-
-        # Perform the initial click to start the game
-        self.click_square(initial_click_row, initial_click_col)
-
-        # Start the solver
-        self.solve_game_time()
+import tkinter as tk
+from tkinter import messagebox
+import json
+import os
+import queue
+import random
+import threading
+import time
+
+from minesweeper_game import DIFFICULTY_LEVELS, MinesweeperGame
+from minesweeper_log import MoveLog
+from minesweeper_solver import SinglePointSolver
+
+
+class MinesweeperGUI:
+    """Minesweeper GUI.
+
+    A thin Tkinter view over a headless MinesweeperGame. All game rules and the
+    solver live outside this class; it only forwards clicks and paints the
+    cells that changed on a single Canvas.
+    """
+
+    DIFFICULTY_LEVELS = DIFFICULTY_LEVELS
+    CELL_SIZE = 32  # Pixels per cell, including the gap between cells
+    CELL_GAP = 2
+
+    def __init__(self, master, rows, cols, num_mines, frame_rate=30, steps_per_frame=None, turbo=False,
+                 board_pool=None, stats=None, log_dir=None):
+        """
+        Args:
+            master (tk.Tk): Window to draw the game in.
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+            num_mines (int): Number of mines on the board.
+            frame_rate (int): Frames per second of the solver animation.
+            steps_per_frame (int): Optional cap on the solver moves painted per
+                frame, to slow the animation down. By default every move queued
+                since the last frame is painted, so an animated solve takes
+                about as long as a headless one.
+            turbo (bool): Paint only the final state of a solve.
+            board_pool (BoardPool): Optional source of no-guess boards; each new
+                game then starts with its starting cell open, or falls back to
+                a random board when none is ready.
+            stats (SolverStats): Optional collector of the solver's counters
+                and timers, plus the time spent painting its moves ('render').
+            log_dir (str): Optional directory where the MoveLog of every game
+                is written when the game ends or is abandoned.
+        """
+        self.master = master
+        self.game = MinesweeperGame(rows, cols, num_mines)
+        self.board_pool = board_pool
+        self.stats = stats
+        self.log_dir = log_dir
+        self.log = None
+        self.replay_job = None
+        self.unprobed_color = "#E0E0E0"
+        self.solver = False
+
+        # Solver animation settings, and the worker thread's solver and move queue
+        self.frame_rate = frame_rate
+        self.steps_per_frame = steps_per_frame
+        self.turbo = tk.BooleanVar(value=turbo)
+        self.solver_worker = None
+        self.move_queue = None
+        self.poll_job = None
+        self.solve_snapshot = None
+        # Moves drained in turbo mode but not yet applied to self.game
+        self.skipped_moves = []
+
+        self.create_widgets()
+        self.load_pooled_board()
+
+    @property
+    def rows(self):
+        return self.game.rows
+
+    @property
+    def cols(self):
+        return self.game.cols
+
+    @property
+    def num_mines(self):
+        return self.game.num_mines
+
+    def create_widgets(self):
+        """Create GUI widgets for the Minesweeper game."""
+        size = self.CELL_SIZE
+        self.canvas = tk.Canvas(self.master, width=self.cols * size, height=self.rows * size,
+                                highlightthickness=0)
+        self.canvas.grid(row=0, column=0, rowspan=5, padx=2, pady=2)
+        self.canvas.bind('<Button-1>', self.on_canvas_click)
+        self.canvas.bind('<Button-3>', self.on_canvas_click)
+
+        # Canvas items per grid position, kept across difficulty changes
+        self.cell_items = {}
+        self.shown_shape = (0, 0)
+        # Cells whose appearance differs from a fresh unprobed cell
+        self.painted = set()
+        self.difficulty_menu = None
+        self.layout_cells()
+
+        # Difficulty change button
+        change_difficulty_button = tk.Button(
+            self.master, text='Change Difficulty', command=self.show_difficulty_menu)
+        change_difficulty_button.grid(
+            row=0, column=1, padx=10, pady=10, sticky='w')
+
+        # Solving button
+        solve_button = tk.Button(
+            self.master, text='Solve', command=self.activate_solver)
+        solve_button.grid(row=1, column=1,
+                          padx=10, pady=10, sticky='w')
+
+        # Stop a running solver
+        stop_button = tk.Button(
+            self.master, text='Stop', command=self.stop_solver)
+        stop_button.grid(row=1, column=2,
+                         padx=10, pady=10, sticky='w')
+
+        # Turbo mode: paint only the final state of the solver
+        turbo_button = tk.Checkbutton(
+            self.master, text='Turbo', variable=self.turbo)
+        turbo_button.grid(row=2, column=1,
+                          padx=10, pady=10, sticky='w')
+
+        # Restart button
+        restart_button = tk.Button(
+            self.master, text="Restart", command=self.restart_game)
+        restart_button.grid(row=3, column=1,
+                            padx=10, pady=10, sticky='w')
+
+        # Status bar with the game counters
+        self.status_label = tk.Label(self.master, text='', font=('Arial', 10))
+        self.status_label.grid(row=4, column=1,
+                               padx=10, pady=10, sticky='w')
+        self.update_status()
+
+    def layout_cells(self):
+        """Size the canvas to the board and show one rectangle and text item per cell.
+
+        Items are pooled by grid position and never move, so switching to a
+        board of another shape only hides, shows or creates the items of the
+        positions that differ between the two shapes.
+        """
+        size, gap = self.CELL_SIZE, self.CELL_GAP
+        self.canvas.config(width=self.cols * size, height=self.rows * size)
+
+        # Reset the cells of the previous game
+        for row, col in self.painted:
+            rect, text = self.cell_items[(row, col)]
+            self.canvas.itemconfig(rect, fill=self.unprobed_color)
+            self.canvas.itemconfig(text, text='')
+        self.painted = set()
+
+        old_rows, old_cols = self.shown_shape
+        for row in range(max(old_rows, self.rows)):
+            for col in range(max(old_cols, self.cols)):
+                shown = row < old_rows and col < old_cols
+                needed = row < self.rows and col < self.cols
+                if shown == needed:
+                    continue
+
+                items = self.cell_items.get((row, col))
+                if items is None:
+                    x, y = col * size, row * size
+                    items = self.cell_items[(row, col)] = (
+                        self.canvas.create_rectangle(
+                            x + gap, y + gap, x + size - gap, y + size - gap,
+                            fill=self.unprobed_color, outline=''),
+                        self.canvas.create_text(
+                            x + size // 2, y + size // 2, text='', font=('Arial', 10), fill='black'))
+                for item in items:
+                    self.canvas.itemconfig(item, state='normal' if needed else 'hidden')
+
+        self.shown_shape = (self.rows, self.cols)
+
+    def cell_at(self, x, y):
+        """Map canvas coordinates to a cell.
+
+        Args:
+            x (int): Horizontal canvas coordinate.
+            y (int): Vertical canvas coordinate.
+
+        Returns:
+            tuple: (row, col) of the cell, or None outside the grid.
+        """
+        row, col = y // self.CELL_SIZE, x // self.CELL_SIZE
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def on_canvas_click(self, event):
+        """Dispatch a left or right click on the canvas to the clicked cell."""
+        cell = self.cell_at(event.x, event.y)
+        if cell is None:
+            return
+        if event.num == 3:
+            self.right_click_square(*cell)
+        else:
+            self.click_square(*cell)
+
+    def paint_cell(self, row, col, text, color):
+        """Reconfigure the canvas items of a single cell.
+
+        Args:
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            text (str): Text shown in the cell.
+            color (str): Background color of the cell.
+        """
+        rect, item_text = self.cell_items[(row, col)]
+        self.canvas.itemconfig(rect, fill=color)
+        self.canvas.itemconfig(item_text, text=text)
+
+        if text or color != self.unprobed_color:
+            self.painted.add((row, col))
+        else:
+            self.painted.discard((row, col))
+
+    def update_status(self):
+        """Show the remaining mines and revealed cells in the status bar."""
+        game = self.game
+        self.status_label.config(
+            text="Mines left: {}\nRevealed: {}/{}".format(
+                game.mines_remaining, game.revealed_count, game.safe_cells))
+
+    def show_difficulty_menu(self):
+        """Show a menu to select difficulty level."""
+        if self.difficulty_menu is not None:
+            self.difficulty_menu.lift()
+            return
+
+        self.difficulty_menu = tk.Toplevel(self.master)
+        self.difficulty_menu.title("Choose Difficulty")
+        self.difficulty_menu.protocol("WM_DELETE_WINDOW", self.close_difficulty_menu)
+
+        for difficulty, config in self.DIFFICULTY_LEVELS.items():
+            button = tk.Button(self.difficulty_menu, text=difficulty.capitalize(),
+                               command=lambda d=difficulty: self.change_difficulty(d))
+            button.pack(pady=5)
+
+    def close_difficulty_menu(self):
+        """Close the difficulty menu if it is open."""
+        if self.difficulty_menu is not None:
+            self.difficulty_menu.destroy()
+            self.difficulty_menu = None
+
+    def change_difficulty(self, difficulty):
+        """Change the difficulty level and reset the game.
+
+        The window, its widgets and the canvas items are reused; only the game
+        state is replaced.
+        """
+        if difficulty in self.DIFFICULTY_LEVELS:
+            rows = self.DIFFICULTY_LEVELS[difficulty]['rows']
+            cols = self.DIFFICULTY_LEVELS[difficulty]['cols']
+            num_mines = self.DIFFICULTY_LEVELS[difficulty]['mines']
+
+            self.close_difficulty_menu()
+            self.stop_solver()
+            self.stop_replay()
+            self.save_log()
+
+            # Start a new game with the updated difficulty level
+            self.game = MinesweeperGame(rows, cols, num_mines)
+            self.solver = False
+            self.layout_cells()
+            self.update_status()
+            self.load_pooled_board()
+        else:
+            messagebox.showwarning("Invalid Difficulty",
+                                   "Please enter a valid difficulty level.")
+
+    def click_square(self, row, col):
+        """Handle a left-click on the specified square.
+
+        Args:
+            row (int): Row index of the square.
+            col (int): Column index of the square.
+        """
+        if self.solver_worker is not None or self.replay_job is not None:
+            return  # The board belongs to the solver or the replay until it finishes
+
+        first_click = self.game.first_click
+        revealed = self.game.reveal(row, col)
+        if first_click:
+            self.log = MoveLog.start(self.game)
+        elif revealed or self.game.lost:
+            self.record_move('reveal', row, col)
+
+        if self.game.lost:
+            self.game_lose()
+            return
+
+        self.paint_revealed(revealed)
+        self.update_status()
+
+        if revealed and self.game.check_win() and self.solver == False:
+            self.game_win()
+
+    def right_click_square(self, row, col):
+        """Handle a right-click on the specified square.
+
+        Args:
+            row (int): Row index of the square.
+            col (int): Column index of the square.
+        """
+        if self.solver_worker is not None or self.replay_job is not None:
+            return  # The board belongs to the solver or the replay until it finishes
+
+        if self.game.toggle_flag(row, col):
+            self.record_move('flag', row, col)
+            self.paint_flag(row, col)
+            self.update_status()
+
+    def paint_revealed(self, cells):
+        """Paint newly revealed cells with their mine counts.
+
+        Args:
+            cells (list): (row, col) tuples of the revealed cells.
+        """
+        for row, col in cells:
+            mines_nearby = self.game.cell_value(row, col)
+
+            # Set the background color for probed cells
+            color = self.get_cell_color(mines_nearby)
+            self.paint_cell(row, col, str(mines_nearby), color)
+
+    def paint_flag(self, row, col):
+        """Update the text and background color of the specified square.
+
+        Args:
+            row (int): Row index of the square.
+            col (int): Column index of the square.
+        """
+        if self.game.is_flagged(row, col):
+            self.paint_cell(row, col, '🚩', '#3BD76A')
+        else:
+            self.paint_cell(row, col, '', self.unprobed_color)
+
+    def get_cell_color(self, value):
+        """Determine the background color for a cell based on its value.
+
+        Args:
+            value: Value of the cell.
+
+        Returns:
+            str: Hexadecimal color code.
+        """
+        low_intensity_color = "#FFE3AF"  # Color for low intensity
+        high_intensity_color = "#3853FF"  # Color for high intensity
+
+        value_range = 8
+        factor = value / value_range
+
+        r_low, g_low, b_low = tuple(
+            int(low_intensity_color[i:i+2], 16) for i in (1, 3, 5))
+        r_high, g_high, b_high = tuple(
+            int(high_intensity_color[i:i+2], 16) for i in (1, 3, 5))
+
+        r = int(r_low + factor * (r_high - r_low))
+        g = int(g_low + factor * (g_high - g_low))
+        b = int(b_low + factor * (b_high - b_low))
+
+        color = "#{:02x}{:02x}{:02x}".format(r, g, b)
+
+        return color
+
+    def show_mines(self):
+        """Reveal all mines on the game board."""
+        for row, col in self.game.mine_positions():
+            self.paint_cell(row, col, '💣', '#2B2B2B')
+
+    def game_lose(self):
+        """Handle the end of the game when the player hits a mine."""
+        self.show_mines()
+        self.save_log()
+        messagebox.showinfo("Game Over", "You hit a mine!")
+        return True
+
+    def game_win(self):
+        """Handle the end of the game when the player wins."""
+        self.show_mines()
+        self.save_log()
+        messagebox.showinfo(
+            "You Win!", "Congratulations! You've probed every non-mine containing cell.")
+        return True
+
+    def restart_game(self):
+        """
+        Resets all game attributes and creates a new board.
+        """
+        self.stop_solver()
+        self.stop_replay()
+        self.save_log()
+
+        # Reset game state; a new board is created on the next click
+        self.game.reset()
+
+        # Repaint only the cells that are not in their initial state
+        for row, col in list(self.painted):
+            self.paint_cell(row, col, '', self.unprobed_color)
+        self.update_status()
+        self.load_pooled_board()
+
+    def load_pooled_board(self):
+        """
+        Start the game on a no-guess board from the pool, if one is ready.
+
+        The board's starting cell is revealed right away. Otherwise the game is
+        left as is, and its board is generated on the first click.
+        """
+        if self.board_pool is None:
+            return
+
+        entry = self.board_pool.take(self.rows, self.cols, self.num_mines)
+        if entry is None:
+            return
+
+        board, row, col, _ = entry
+        self.game.load_board(bytearray(board), row, col)
+        self.log = MoveLog.start(self.game)
+        self.paint_revealed(self.game.reveal(row, col))
+        self.update_status()
+
+    def run_solver(self, solver, moves):
+        """
+        Run the solver to completion; executed in the worker thread.
+
+        Args:
+            solver (SinglePointSolver): Solver working on a copy of the game.
+            moves (queue.Queue): Queue the solver's moves are pushed to, with
+                the time each was made, followed by None when it is done.
+        """
+        for move in solver.stage('solve', solver.moves()):
+            moves.put((move, time.perf_counter()))
+        moves.put(None)
+
+    def poll_moves(self):
+        """
+        Apply and paint the solver moves queued since the last frame.
+
+        Each move is applied to the GUI's own game, so the board and the status
+        bar follow the worker. If `steps_per_frame` is set, the rest of the
+        queue waits for the next frame. In turbo mode moves are only logged and kept
+        aside; once the worker is done its final game replaces the GUI's and
+        only the changed cells are painted. After a turbo frame the rest of the
+        solve stays in turbo mode, since the GUI's game is behind.
+        """
+        start_time = time.perf_counter()
+        turbo = self.turbo.get() or bool(self.skipped_moves)
+        limit = self.steps_per_frame
+        steps = 0
+        while turbo or limit is None or steps < limit:
+            try:
+                move = self.move_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if move is None:
+                game = self.solver_worker.game
+                skipped = self.skipped_moves
+                self.end_solver()
+                if skipped:
+                    self.game = game
+                    self.paint_changes(self.solve_snapshot)
+                else:
+                    self.update_status()
+                self.add_render_time(start_time)
+                self.finish_solve(self.game.check_win())
+                return
+
+            move, when = move
+            self.record_move(move.action, move.row, move.col, when)
+            if turbo:
+                self.skipped_moves.append(move)
+            elif move.action == 'flag':
+                if self.game.toggle_flag(move.row, move.col):
+                    self.paint_flag(move.row, move.col)
+            else:
+                self.paint_revealed(self.game.reveal(move.row, move.col))
+            steps += 1
+
+        if not turbo:
+            self.update_status()
+        self.add_render_time(start_time)
+        self.poll_job = self.master.after(
+            max(1, 1000 // self.frame_rate), self.poll_moves)
+
+    def add_render_time(self, start_time):
+        """
+        Count the time since start_time as painting time, if stats are enabled.
+
+        Args:
+            start_time (float): time.perf_counter() value at the start of painting.
+        """
+        if self.stats is not None:
+            self.stats.timers['render'] += time.perf_counter() - start_time
+
+    def end_solver(self):
+        """Stop polling the worker and forget it."""
+        if self.poll_job is not None:
+            self.master.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.solver_worker = None
+        self.move_queue = None
+        self.skipped_moves = []
+
+    def stop_solver(self):
+        """
+        Cancel a running solver.
+
+        The worker stops after its current step. Steps already painted, or
+        drained in turbo mode, stay on the board; the rest are dropped.
+        """
+        if self.solver_worker is not None:
+            self.solver_worker.cancel()
+            skipped = self.skipped_moves
+            self.end_solver()
+            if skipped:
+                for move in skipped:
+                    self.game.apply_move(move.action, move.row, move.col)
+                self.paint_changes(self.solve_snapshot)
+
+    def paint_changes(self, snapshot):
+        """
+        Paint every cell whose state differs from a game snapshot.
+
+        Args:
+            snapshot (tuple): Value returned by MinesweeperGame.snapshot().
+        """
+        for row, col in self.game.changed_cells(snapshot):
+            if self.game.is_revealed(row, col):
+                self.paint_revealed([(row, col)])
+            else:
+                self.paint_flag(row, col)
+        self.update_status()
+
+    def activate_solver(self):
+        """
+        Activate the solve_game method
+        """
+        self.solver = True
+        self.solve_game()
+
+    def solve_game(self):
+        """
+        Solve the game using the Single Point (SP) strategy
+
+        The headless SinglePointSolver runs in a worker thread on a copy of the
+        game; poll_moves shows its progress.
+        """
+        if self.game.first_click or self.solver_worker is not None or self.replay_job is not None:
+            return
+
+        moves = queue.Queue()
+        self.solver_worker = SinglePointSolver(self.game.copy(), stats=self.stats)
+        self.move_queue = moves
+        self.solve_snapshot = self.game.snapshot()
+
+        threading.Thread(target=self.run_solver, args=(self.solver_worker, moves),
+                         daemon=True).start()
+        self.poll_job = self.master.after(0, self.poll_moves)
+
+    def finish_solve(self, solved):
+        """
+        Report the result of the solver.
+
+        Args:
+            solved (bool): True if the solver solved the puzzle.
+        """
+        if self.game.lost:
+            self.game_lose()
+        elif solved:
+            self.save_log()
+            messagebox.showinfo(
+                "Win!", "Hooray, I solved the puzzle! ╰( ⁀‿⁀ )╯")
+        else:
+            messagebox.showinfo(
+                "Solver Stopped", "Sorry, couldn't solve the whole puzzle (っ˘̩╭╮˘̩)っ")
+
+    def solve_game_time(self):
+        """
+        Solve the game using the Single Point (SP) strategy (for tracking time)
+
+        Only the solver is timed; it runs on the main thread and nothing is
+        painted. With stats enabled they are printed as JSON after the time.
+        """
+        start_time = time.perf_counter()
+        SinglePointSolver(self.game, stats=self.stats).solve()
+        end_time = time.perf_counter()
+
+        print((end_time - start_time) * 1000)
+        if self.stats is not None:
+            print(json.dumps(self.stats.as_dict(), indent=2))
+        self.master.destroy()
+
+    def record_move(self, action, row, col, when=None):
+        """
+        Add a move to the log of the current game, if it has one.
+
+        Clicks, flags and solver moves are all recorded, with their times.
+
+        Args:
+            action (str): 'reveal', 'flag' or 'guess'.
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            when (float): time.perf_counter() value of the move (default: now).
+        """
+        if self.log is not None:
+            self.log.record(action, row, col, when)
+
+    def save_log(self):
+        """
+        Write the log of the current game to the log directory and close it.
+
+        Nothing is written without a log directory; the log is dropped either way.
+        """
+        if self.log is not None and self.log_dir is not None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            path = os.path.join(self.log_dir, "{}-{:03d}.mslog".format(
+                time.strftime("%Y%m%d-%H%M%S"), int(time.time() * 1000) % 1000))
+            with open(path, 'wb') as f:
+                f.write(self.log.to_bytes())
+        self.log = None
+
+    def replay_log(self, log, moves_per_second=20):
+        """
+        Play a recorded game back on the board.
+
+        The logged board is loaded with its first click revealed, then one move
+        is applied per tick. Clicks and the solver are ignored until the replay
+        ends.
+
+        Args:
+            log (MoveLog): Log to play back.
+            moves_per_second (float): Playback speed.
+        """
+        self.stop_solver()
+        self.stop_replay()
+        self.save_log()
+
+        self.game = log.game()
+        self.layout_cells()
+        self.paint_changes(MinesweeperGame(log.rows, log.cols, log.num_mines).snapshot())
+        self.replay_job = self.master.after(
+            0, self.play_replay, log.moves(), max(1, int(1000 / moves_per_second)))
+
+    def play_replay(self, moves, delay):
+        """
+        Apply and paint the next move of a replay, then schedule the one after.
+
+        Args:
+            moves (iterator): Remaining moves, from MoveLog.moves().
+            delay (int): Milliseconds between moves.
+        """
+        move = next(moves, None)
+        if move is None:
+            self.replay_job = None
+            if self.game.lost:
+                self.show_mines()
+            return
+
+        action, row, col, _ = move
+        if action == 'flag':
+            self.game.toggle_flag(row, col)
+            self.paint_flag(row, col)
+        else:
+            self.paint_revealed(self.game.reveal(row, col))
+        self.update_status()
+        self.replay_job = self.master.after(delay, self.play_replay, moves, delay)
+
+    def stop_replay(self):
+        """Stop a running replay, leaving the board as it is."""
+        if self.replay_job is not None:
+            self.master.after_cancel(self.replay_job)
+            self.replay_job = None
+
+    def activate_first_click(self):
+        """
+        Randomly choose first click on the grid and start the game.
+        """
+        self.solver = True
+
+        # Randomly select a cell to click
+        initial_click_row = random.randint(0, self.rows - 1)
+        initial_click_col = random.randint(0, self.cols - 1)
+
+        # Perform the initial click to start the game
+        self.click_square(initial_click_row, initial_click_col)
+
+        # Start the solver
+        self.solve_game_time()
@@ -0,0 +1,356 @@
+import copy
+from itertools import islice
+
+from minesweeper_game import MINE_VALUE, MinesweeperGame
+from minesweeper_solver import SinglePointSolver
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; chunks are then generated in pure Python
+    np = None
+
+
+# Chunks are CHUNK x CHUNK cells
+CHUNK_BITS = 6
+CHUNK = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK - 1
+
+MASK64 = (1 << 64) - 1
+
+# Multipliers of the cell hash (splitmix64)
+SEED_FACTOR = 0x9E3779B97F4A7C15
+ROW_FACTOR = 0xD1B54A32D192ED03
+COL_FACTOR = 0xABC98388FB8FAC03
+MIX_1 = 0xBF58476D1CE4E5B9
+MIX_2 = 0x94D049BB133111EB
+
+
+def cell_hash(seed, row, col):
+    """
+    Deterministic 64-bit hash of a cell.
+
+    Args:
+        seed (int): Board seed.
+        row (int): Row index of the cell.
+        col (int): Column index of the cell.
+
+    Returns:
+        int: Hash in [0, 2**64).
+    """
+    x = (seed * SEED_FACTOR + row * ROW_FACTOR + col * COL_FACTOR) & MASK64
+    x ^= x >> 30
+    x = (x * MIX_1) & MASK64
+    x ^= x >> 27
+    x = (x * MIX_2) & MASK64
+    return x ^ (x >> 31)
+
+
+def cell_hashes(seed, rows, cols):
+    """
+    Vectorized cell_hash over a grid of rows and columns. Requires NumPy.
+
+    Args:
+        seed (int): Board seed.
+        rows (numpy.ndarray): (height, 1) uint64 row indices.
+        cols (numpy.ndarray): (1, width) uint64 column indices.
+
+    Returns:
+        numpy.ndarray: (height, width) uint64 hashes, equal to cell_hash.
+    """
+    with np.errstate(over='ignore'):
+        x = (np.uint64(seed * SEED_FACTOR & MASK64) + rows * np.uint64(ROW_FACTOR)
+             + cols * np.uint64(COL_FACTOR))
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(MIX_1)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(MIX_2)
+        return x ^ (x >> np.uint64(31))
+
+
+class ChunkedGrid:
+    """Sparse byte grid over the padded flat layout of MinesweeperGame.
+
+    Supports the `grid[idx]` reads and writes the game and the solver make on
+    their bytearray buffers. Storage is split into CHUNK x CHUNK chunks of
+    the padded board, each created by `fill(padded_row, padded_col)` (the
+    padded position of its top-left cell) the first time it is touched.
+    """
+
+    def __init__(self, stride, fill):
+        """
+        Args:
+            stride (int): Width of the padded board, cols + 2.
+            fill (callable): Returns the initial bytearray of a chunk.
+        """
+        self.stride = stride
+        self.fill = fill
+        self.chunks = {}
+
+    def chunk(self, key):
+        """bytearray: The chunk with the given (chunk row, chunk col) key, created if needed."""
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = self.fill(key[0] << CHUNK_BITS, key[1] << CHUNK_BITS)
+        return chunk
+
+    def __getitem__(self, idx):
+        row, col = divmod(idx, self.stride)
+        return self.chunk((row >> CHUNK_BITS, col >> CHUNK_BITS))[
+            (row & CHUNK_MASK) << CHUNK_BITS | col & CHUNK_MASK]
+
+    def __setitem__(self, idx, value):
+        row, col = divmod(idx, self.stride)
+        self.chunk((row >> CHUNK_BITS, col >> CHUNK_BITS))[
+            (row & CHUNK_MASK) << CHUNK_BITS | col & CHUNK_MASK] = value
+
+    def __iter__(self):
+        # Without this, iter() and bytes() would fall back to indexing from 0
+        # upwards, creating chunks forever
+        raise TypeError("a ChunkedGrid cannot be iterated; use nonzero()")
+
+    def nonzero(self):
+        """Iterate over the flat indices of the non-zero cells of the created chunks."""
+        for (chunk_row, chunk_col), chunk in list(self.chunks.items()):
+            row0, col0 = chunk_row << CHUNK_BITS, chunk_col << CHUNK_BITS
+            for pos, value in enumerate(chunk):
+                if value:
+                    yield (row0 + (pos >> CHUNK_BITS)) * self.stride + col0 + (pos & CHUNK_MASK)
+
+    def copy(self):
+        """ChunkedGrid: Independent copy, sharing the fill function."""
+        other = ChunkedGrid(self.stride, self.fill)
+        other.chunks = {key: bytearray(chunk) for key, chunk in self.chunks.items()}
+        return other
+
+
+class InfiniteGame(MinesweeperGame):
+    """Huge Minesweeper board generated lazily, with sparse state.
+
+    A cell holds a mine when a hash of (seed, row, col) falls below the
+    density, so the board never has to be generated as a whole. Mine counts
+    are computed a chunk at a time when first read, and the revealed, flag
+    and neighbor-count buffers are ChunkedGrids, so memory grows with the
+    part of the board that has been touched. Everything else is inherited
+    from MinesweeperGame, including the flood fill, and SinglePointSolver
+    runs on it unchanged.
+
+    The mine count is only expected (density * cells), so the game never
+    reports a win and the probability stage of the solver does not apply;
+    solve with guess=False. Densities below about 0.1 let empty regions grow
+    without bound on large boards. Whole-board operations (indices,
+    snapshot, changed_cells, mine_positions) raise NotImplementedError.
+    """
+
+    def __init__(self, rows=1_000_000, cols=1_000_000, density=0.16, seed=0):
+        """
+        Args:
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+            density (float): Probability of a mine on any cell.
+            seed (int): Board seed.
+        """
+        self.density = density
+        self.seed = seed
+        self.threshold = int(density * (1 << 64))
+        super().__init__(rows, cols, round(density * rows * cols), seed=seed)
+
+    def reset(self):
+        """Clear the board so that the next reveal starts a new game."""
+        self.board = None
+        self.revealed = ChunkedGrid(self.stride, self.revealed_chunk)
+        self.flags = ChunkedGrid(self.stride, self.zero_chunk)
+        self.initial_click_row = None
+        self.initial_click_col = None
+        self.first_click = True
+        self.lost = False
+        self.journal = None
+        self.checkpoints = []
+
+        self.revealed_count = 0
+        self.flag_count = 0
+
+        self.unrevealed_neighbors = ChunkedGrid(self.stride, self.unrevealed_chunk)
+        self.flagged_neighbors = ChunkedGrid(self.stride, self.zero_chunk)
+
+    def copy(self):
+        """
+        Return an independent copy of the game state.
+
+        Returns:
+            InfiniteGame: The copy.
+        """
+        other = copy.copy(self)
+        other.journal = None
+        other.checkpoints = []
+        other.revealed = self.revealed.copy()
+        other.flags = self.flags.copy()
+        other.unrevealed_neighbors = self.unrevealed_neighbors.copy()
+        other.flagged_neighbors = self.flagged_neighbors.copy()
+        return other
+
+    def start(self, row, col):
+        """Set the first click, whose 3x3 window is kept free of mines.
+
+        Args:
+            row (int): Row index of the initially clicked cell.
+            col (int): Column index of the initially clicked cell.
+        """
+        self.initial_click_row = row
+        self.initial_click_col = col
+        self.board = ChunkedGrid(self.stride, self.board_chunk)
+        self.first_click = False
+
+    def indices(self):
+        """Iterating over every cell is not supported on a lazily generated board."""
+        raise NotImplementedError("InfiniteGame cells cannot be enumerated")
+
+    def revealed_indices(self):
+        """Iterate over the flat indices of the revealed cells."""
+        rows, cols, stride = self.rows, self.cols, self.stride
+        for idx in self.revealed.nonzero():
+            row, col = divmod(idx, stride)
+            if 1 <= row <= rows and 1 <= col <= cols:
+                yield idx
+
+    def snapshot(self):
+        """Snapshots of the whole state are not supported on a lazily generated board."""
+        raise NotImplementedError("InfiniteGame state cannot be snapshotted")
+
+    def changed_cells(self, snapshot):
+        """Not supported, see snapshot()."""
+        raise NotImplementedError("InfiniteGame state cannot be snapshotted")
+
+    def mine_positions(self):
+        """Listing every mine is not supported on a lazily generated board."""
+        raise NotImplementedError("InfiniteGame mines cannot be enumerated")
+
+    def check_win(self):
+        """Always False: the number of safe cells of the board is not known."""
+        return False
+
+    @property
+    def touched_chunks(self):
+        """int: Number of chunks created across all buffers."""
+        grids = (self.revealed, self.flags, self.unrevealed_neighbors,
+                 self.flagged_neighbors, self.board)
+        return sum(len(grid.chunks) for grid in grids if grid is not None)
+
+    def interior(self, row0, col0):
+        """bool: Whether the chunk at padded (row0, col0) lies inside the board."""
+        return (row0 >= 1 and col0 >= 1 and
+                row0 + CHUNK <= self.rows + 1 and col0 + CHUNK <= self.cols + 1)
+
+    def zero_chunk(self, row0, col0):
+        """Initial chunk of the flag buffers."""
+        return bytearray(CHUNK * CHUNK)
+
+    def revealed_chunk(self, row0, col0):
+        """Initial chunk of the revealed buffer: border cells count as revealed."""
+        if self.interior(row0, col0):
+            return bytearray(CHUNK * CHUNK)
+        return bytearray(0 if 1 <= row <= self.rows and 1 <= col <= self.cols else 1
+                         for row in range(row0, row0 + CHUNK)
+                         for col in range(col0, col0 + CHUNK))
+
+    def unrevealed_chunk(self, row0, col0):
+        """Initial chunk of the unrevealed-neighbor buffer (see initial_buffers)."""
+        if self.interior(row0, col0) and row0 > 1 and col0 > 1 and \
+                row0 + CHUNK <= self.rows and col0 + CHUNK <= self.cols:
+            return bytearray(b'\x09' * (CHUNK * CHUNK))
+
+        rows, cols = self.rows, self.cols
+
+        def span(position, size):
+            # Size of the clipped window around a padded position
+            if not 1 <= position <= size:
+                return None
+            return min(position + 1, size) - max(position - 1, 1) + 1
+
+        chunk = bytearray(CHUNK * CHUNK)
+        for i in range(CHUNK):
+            row_span = span(row0 + i, rows)
+            for j in range(CHUNK):
+                col_span = span(col0 + j, cols)
+                chunk[i << CHUNK_BITS | j] = (9 if row_span is None or col_span is None
+                                              else row_span * col_span)
+        return chunk
+
+    def mine_window(self, row0, col0, size):
+        """
+        Mine mask of a square of padded cells.
+
+        Args:
+            row0 (int): Padded row of the top-left cell.
+            col0 (int): Padded column of the top-left cell.
+            size (int): Side of the square.
+
+        Returns:
+            list: size lists of size booleans.
+        """
+        safe_row, safe_col = self.initial_click_row + 1, self.initial_click_col + 1
+        row_range = [row for row in range(row0, row0 + size) if 1 <= row <= self.rows]
+        col_range = [col for col in range(col0, col0 + size) if 1 <= col <= self.cols]
+
+        mines = [[False] * size for _ in range(size)]
+        if not row_range or not col_range:
+            return mines
+
+        if np is not None:
+            hashes = cell_hashes(self.seed,
+                                 np.array(row_range, dtype=np.uint64)[:, None] - np.uint64(1),
+                                 np.array(col_range, dtype=np.uint64)[None, :] - np.uint64(1))
+            below = (hashes < np.uint64(self.threshold)).tolist()
+        else:
+            below = [[cell_hash(self.seed, row - 1, col - 1) < self.threshold
+                      for col in col_range] for row in row_range]
+
+        for row, values in zip(row_range, below):
+            line = mines[row - row0]
+            near_row = abs(row - safe_row) <= 1
+            for col, mine in zip(col_range, values):
+                if mine and not (near_row and abs(col - safe_col) <= 1):
+                    line[col - col0] = True
+        return mines
+
+    def board_chunk(self, row0, col0):
+        """Mine counts of a chunk, with MINE_VALUE marking mines and 0 on the border."""
+        mines = self.mine_window(row0 - 1, col0 - 1, CHUNK + 2)
+
+        # Board cells of the chunk; the border keeps 0
+        cols = range(max(col0, 1) - col0, min(col0 + CHUNK, self.cols + 1) - col0)
+
+        chunk = bytearray(CHUNK * CHUNK)
+        for i in range(max(row0, 1) - row0, min(row0 + CHUNK, self.rows + 1) - row0):
+            above, line, below = mines[i], mines[i + 1], mines[i + 2]
+            for j in cols:
+                if line[j + 1]:
+                    chunk[i << CHUNK_BITS | j] = MINE_VALUE
+                else:
+                    chunk[i << CHUNK_BITS | j] = (sum(above[j:j + 3]) + sum(line[j:j + 3]) +
+                                                  sum(below[j:j + 3]))
+        return chunk
+
+
+def explore(rows=1_000_000, cols=1_000_000, density=0.16, seed=0, row=None, col=None,
+            max_moves=None):
+    """
+    Open a cell of a huge board and let the solver deduce as far as it can.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        density (float): Probability of a mine on any cell.
+        seed (int): Board seed.
+        row (int): Row of the first click (default: the middle of the board).
+        col (int): Column of the first click (default: the middle of the board).
+        max_moves (int): Stop after this many solver moves (default: no limit).
+            At low densities the deducible region can be very large.
+
+    Returns:
+        InfiniteGame: The game, in the state where the solver stopped.
+    """
+    game = InfiniteGame(rows, cols, density, seed)
+    game.reveal(rows // 2 if row is None else row, cols // 2 if col is None else col)
+    for _ in islice(SinglePointSolver(game).moves(), max_moves):
+        pass
+    return game
@@ -0,0 +1,401 @@
+import argparse
+import json
+import struct
+import sys
+import time
+
+from minesweeper_corpus import mask_size
+from minesweeper_game import MinesweeperGame, board_buffer_from_mask, pack_mines
+
+
+# Log header: magic, format version, rows, cols, mines
+HEADER = struct.Struct('<4sBHHI')
+MAGIC = b'MSML'
+VERSION = 2
+
+# Move actions by their 2-bit code
+ACTIONS = ('reveal', 'flag', 'guess')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+
+def write_varint(out, value):
+    """
+    Append an unsigned LEB128 varint to a buffer.
+
+    Args:
+        out (bytearray): Buffer to extend.
+        value (int): Non-negative integer.
+    """
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Decode an unsigned LEB128 varint.
+
+    Args:
+        data (bytes-like): Encoded data.
+        offset (int): Position of the first byte.
+
+    Returns:
+        tuple: (value, offset just past the varint).
+    """
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class MoveLog:
+    """Compact record of one game: its board, first click and every move.
+
+    The board is stored as the bit-packed mine mask of minesweeper_corpus, so
+    a log replays the same game whatever generated it. Each move takes two
+    varints: the row-major cell number shifted left by two with the action
+    code in the low bits, then the microseconds since the previous move. A
+    solver move on an Expert board usually fits in 3-4 bytes.
+    """
+
+    def __init__(self, rows, cols, num_mines, mask, row, col, data=None, count=0):
+        """
+        Args:
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+            num_mines (int): Number of mines on the board.
+            mask (bytes): Bit-packed mine mask, see pack_mines.
+            row (int): Row index of the first click.
+            col (int): Column index of the first click.
+            data (bytearray): Encoded moves (default: none yet).
+            count (int): Number of moves in data.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.num_mines = num_mines
+        self.mask = bytes(mask)
+        self.row = row
+        self.col = col
+        self.data = bytearray() if data is None else data
+        self.count = count
+
+        # Recording clock: time.perf_counter() at creation, and the time of
+        # the last move in microseconds since then
+        self.started = time.perf_counter()
+        self.elapsed_us = 0
+
+    @classmethod
+    def start(cls, game):
+        """
+        Start a log for a game whose board has been generated.
+
+        Args:
+            game (MinesweeperGame): Game after its first click.
+
+        Returns:
+            MoveLog: An empty log of the game.
+        """
+        mask = pack_mines(game.rows, game.cols,
+                          [row * game.cols + col for row, col in game.mine_positions()])
+        return cls(game.rows, game.cols, game.num_mines, mask,
+                   game.initial_click_row, game.initial_click_col)
+
+    def __len__(self):
+        return self.count
+
+    def record(self, action, row, col, when=None):
+        """
+        Append a move.
+
+        Args:
+            action (str): 'reveal', 'flag' (which toggles the flag) or 'guess'.
+            row (int): Row index of the cell.
+            col (int): Column index of the cell.
+            when (float): time.perf_counter() value of the move (default: now).
+        """
+        if when is None:
+            when = time.perf_counter()
+        delta = max(0, int((when - self.started) * 1e6) - self.elapsed_us)
+        self.elapsed_us += delta
+
+        write_varint(self.data, (row * self.cols + col) << 2 | ACTION_CODES[action])
+        write_varint(self.data, delta)
+        self.count += 1
+
+    def record_move(self, move, when=None):
+        """Append a solver Move; usable as a SinglePointSolver callback."""
+        self.record(move.action, move.row, move.col, when)
+
+    def moves(self):
+        """
+        Decode the moves.
+
+        Yields:
+            tuple: (action, row, col, seconds since the log started).
+        """
+        data, cols = self.data, self.cols
+        offset = elapsed = 0
+        for _ in range(self.count):
+            code, offset = read_varint(data, offset)
+            delta, offset = read_varint(data, offset)
+            elapsed += delta
+            row, col = divmod(code >> 2, cols)
+            yield ACTIONS[code & 3], row, col, elapsed / 1e6
+
+    def game(self):
+        """
+        Rebuild the game at its start.
+
+        Returns:
+            MinesweeperGame: The logged board with the first click revealed.
+        """
+        game = MinesweeperGame(self.rows, self.cols, self.num_mines)
+        game.load_board(board_buffer_from_mask(self.rows, self.cols, self.mask),
+                        self.row, self.col)
+        game.reveal(self.row, self.col)
+        return game
+
+    def to_bytes(self):
+        """
+        Encode the log.
+
+        Returns:
+            bytes: Header, first click, mine mask, move count, moves.
+        """
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.rows, self.cols, self.num_mines))
+        write_varint(out, self.row)
+        write_varint(out, self.col)
+        out += self.mask
+        write_varint(out, self.count)
+        write_varint(out, len(self.data))
+        out += self.data
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """
+        Decode a log written by to_bytes().
+
+        Args:
+            data (bytes-like): Encoded data, possibly holding several logs.
+            offset (int): Position of the log.
+
+        Returns:
+            tuple: (MoveLog, offset just past the log).
+
+        Raises:
+            ValueError: If the data is not a move log.
+        """
+        if len(data) - offset < HEADER.size:
+            raise ValueError("truncated move log")
+        magic, version, rows, cols, num_mines = HEADER.unpack_from(data, offset)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a move log")
+
+        try:
+            row, offset = read_varint(data, offset + HEADER.size)
+            col, offset = read_varint(data, offset)
+            size = mask_size(rows, cols)
+            mask = bytes(data[offset:offset + size])
+            count, offset = read_varint(data, offset + size)
+            length, offset = read_varint(data, offset)
+        except IndexError:
+            raise ValueError("truncated move log") from None
+        if len(mask) != size or len(data) - offset < length:
+            raise ValueError("truncated move log")
+
+        moves = bytearray(data[offset:offset + length])
+        return cls(rows, cols, num_mines, mask, row, col, moves, count), offset + length
+
+
+def write_logs(path, logs):
+    """Write move logs one after another to a file."""
+    with open(path, 'wb') as f:
+        for log in logs:
+            f.write(log.to_bytes())
+
+
+def read_logs(path):
+    """
+    Read every log of a file written by write_logs or MoveLog.to_bytes.
+
+    Args:
+        path (str): Log file.
+
+    Returns:
+        list: The MoveLogs, in file order.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    logs = []
+    offset = 0
+    while offset < len(data):
+        log, offset = MoveLog.from_bytes(data, offset)
+        logs.append(log)
+    return logs
+
+
+def replay(log):
+    """
+    Apply the moves of a log to its board as fast as possible.
+
+    Args:
+        log (MoveLog): Log to replay.
+
+    Returns:
+        MinesweeperGame: The game in its final state.
+    """
+    game = log.game()
+    for action, row, col, _ in log.moves():
+        if action == 'flag':
+            game.toggle_flag(row, col)
+        else:
+            game.reveal(row, col)
+    return game
+
+
+def rerun(log, **options):
+    """
+    Solve the logged board again with the current solver, recording a new log.
+
+    Args:
+        log (MoveLog): Log whose board and first click are used.
+        **options: Keyword arguments of SinglePointSolver (guess, use_subsets, ...).
+
+    Returns:
+        MoveLog: Log of the new solve.
+    """
+    from minesweeper_solver import SinglePointSolver
+
+    game = log.game()
+    new_log = MoveLog.start(game)
+    SinglePointSolver(game, callback=new_log.record_move, **options).solve()
+    return new_log
+
+
+def first_difference(log, other):
+    """
+    Find where two logs of the same board stop making the same moves.
+
+    Timestamps are ignored.
+
+    Args:
+        log (MoveLog): First log.
+        other (MoveLog): Second log.
+
+    Returns:
+        int: Number of the first differing move, or None if the logs agree.
+    """
+    moves = [move[:3] for move in log.moves()]
+    other_moves = [move[:3] for move in other.moves()]
+    for i, (move, other_move) in enumerate(zip(moves, other_moves)):
+        if move != other_move:
+            return i
+    if len(moves) != len(other_moves):
+        return min(len(moves), len(other_moves))
+    return None
+
+
+def latencies(log):
+    """
+    Time taken by each move of a log.
+
+    Returns:
+        list: Milliseconds between each move and the previous one (or the
+        start of the log for the first move).
+    """
+    previous = 0.0
+    result = []
+    for *_, seconds in log.moves():
+        result.append((seconds - previous) * 1000)
+        previous = seconds
+    return result
+
+
+def replay_report(logs, check=False, **options):
+    """
+    Replay logs headlessly and summarize them.
+
+    Args:
+        logs (list): MoveLogs to replay.
+        check (bool): Also solve every board again and count the logs the
+            current solver no longer reproduces.
+        **options: SinglePointSolver keyword arguments for the check.
+
+    Returns:
+        dict: Game outcomes, replay throughput and the logged per-move latency.
+    """
+    from minesweeper_benchmark import percentile
+
+    start_time = time.perf_counter()
+    games = [replay(log) for log in logs]
+    elapsed = time.perf_counter() - start_time
+
+    moves = sum(len(log) for log in logs)
+    move_latencies = sorted(latency for log in logs for latency in latencies(log))
+    report = {
+        'games': len(logs),
+        'wins': sum(1 for game in games if game.check_win()),
+        'losses': sum(1 for game in games if game.lost),
+        'moves': moves,
+        'replay_time_s': elapsed,
+        'moves_per_s': moves / elapsed if elapsed else 0.0,
+        'move_latency_ms': {
+            'p50': percentile(move_latencies, 0.50),
+            'p95': percentile(move_latencies, 0.95),
+            'p99': percentile(move_latencies, 0.99),
+            'max': move_latencies[-1] if move_latencies else 0.0,
+        },
+    }
+    if check:
+        report['mismatches'] = []
+        for i, log in enumerate(logs):
+            difference = first_difference(log, rerun(log, **options))
+            if difference is not None:
+                report['mismatches'].append({'game': i, 'move': difference})
+    return report
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded Minesweeper games.")
+    parser.add_argument('logs', help="move log file")
+    parser.add_argument('--check', action='store_true',
+                        help="solve every board again and report the games whose "
+                             "moves changed")
+    parser.add_argument('-g', '--guess', action='store_true',
+                        help="let the checking solver guess, as the logged one did")
+    parser.add_argument('--gui', action='store_true',
+                        help="play a game back in the GUI instead")
+    parser.add_argument('--game', type=int, default=0,
+                        help="game of the file to play back with --gui (default: 0)")
+    parser.add_argument('--speed', type=float, default=20,
+                        help="GUI playback speed in moves per second (default: 20)")
+    args = parser.parse_args(argv)
+
+    logs = read_logs(args.logs)
+    if args.gui:
+        import tkinter as tk
+        from minesweeper_gui import MinesweeperGUI
+
+        log = logs[args.game]
+        root = tk.Tk()
+        root.title("Minesweeper replay")
+        gui = MinesweeperGUI(root, log.rows, log.cols, log.num_mines)
+        gui.replay_log(log, args.speed)
+        root.mainloop()
+        return
+
+    json.dump(replay_report(logs, args.check, guess=args.guess), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
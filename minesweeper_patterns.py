@@ -0,0 +1,241 @@
+import argparse
+import json
+from functools import lru_cache
+
+from minesweeper_game import DIFFICULTY_LEVELS, MinesweeperGame
+from minesweeper_probability import component_signature, enumerate_component
+
+
+# Cells of the 5x5 window as (row, col) deltas, row by row
+WINDOW = tuple((di, dj) for di in range(-2, 3) for dj in range(-2, 3))
+WINDOW_SIZE = len(WINDOW)
+
+# Only the cells of the inner 3x3 act as constraints, since their own 3x3
+# windows lie inside the 5x5 one
+INNER = tuple(pos for pos, (di, dj) in enumerate(WINDOW) if abs(di) <= 1 and abs(dj) <= 1)
+IS_INNER = tuple(pos in INNER for pos in range(WINDOW_SIZE))
+
+# Bit mask of the window positions in the 3x3 window of each position
+NEIGHBOR_MASKS = tuple(sum(1 << pos for pos, (ei, ej) in enumerate(WINDOW)
+                           if abs(ei - di) <= 1 and abs(ej - dj) <= 1)
+                       for di, dj in WINDOW)
+
+# Keys hold one digit per inner cell: NO_CONSTRAINT, or 1 + its mines left
+NO_CONSTRAINT = 0
+BASE = 10
+
+
+@lru_cache(maxsize=None)
+def window_offsets(cols):
+    """
+    Offsets of the 5x5 window in the padded flat layout.
+
+    Args:
+        cols (int): Number of columns in the game board.
+
+    Returns:
+        tuple: The 25 index offsets, in WINDOW order.
+    """
+    stride = cols + 2
+    return tuple(di * stride + dj for di, dj in WINDOW)
+
+
+def window_key(game, idx):
+    """
+    Encode the 5x5 window around a cell.
+
+    The key holds the unknown cells (neither revealed nor flagged) as a bit
+    mask over the window, and the mines left around each revealed cell of the
+    inner 3x3 (the constraints). Constraints without unknown neighbors and
+    unknown cells without a constraint neighbor cannot take part in a
+    deduction, so they are left out; windows that differ only there share a
+    key. Cells off the board count as known.
+
+    Args:
+        game (MinesweeperGame): Game to read.
+        idx (int): Flat index of the center cell.
+
+    Returns:
+        int: The key, or None if no constraint is left.
+    """
+    board, revealed, flags = game.board, game.revealed, game.flags
+    flagged_neighbors = game.flagged_neighbors
+    row, col = game.position(idx)
+    # Window cells beyond the one-cell border would wrap around in the flat
+    # layout; near the edges each cell is checked against the board instead
+    inside = 1 <= row <= game.rows - 2 and 1 <= col <= game.cols - 2
+
+    unknown = 0
+    mines_left = {}
+    for pos, offset in enumerate(window_offsets(game.cols)):
+        if not inside:
+            di, dj = WINDOW[pos]
+            if not (0 <= row + di < game.rows and 0 <= col + dj < game.cols):
+                continue
+        cell = idx + offset
+        if not revealed[cell]:
+            if not flags[cell]:
+                unknown |= 1 << pos
+        elif IS_INNER[pos] and board[cell] >= flagged_neighbors[cell]:
+            mines_left[pos] = board[cell] - flagged_neighbors[cell]
+
+    key = 0
+    relevant = 0
+    for pos in INNER:
+        digit = NO_CONSTRAINT
+        if pos in mines_left and unknown & NEIGHBOR_MASKS[pos]:
+            digit = 1 + mines_left[pos]
+            relevant |= unknown & NEIGHBOR_MASKS[pos]
+        key = key * BASE + digit
+    if not relevant:
+        return None
+    return relevant << 32 | key
+
+
+def solve_window(key):
+    """
+    Find the cells of a window forced by the window's own constraints.
+
+    Every mine assignment of the unknown cells satisfying the constraints of
+    the inner 3x3 is counted; a cell that is a mine in none of them is safe and
+    one that is a mine in all of them is a mine. The constraints are a subset
+    of the board's, so the deductions hold on the board.
+
+    Args:
+        key (int): Window key from window_key.
+
+    Returns:
+        tuple: (safe, mines), tuples of window positions (indices into WINDOW).
+    """
+    unknown, digits = key >> 32, key & 0xFFFFFFFF
+
+    constraints = []
+    for pos in reversed(INNER):
+        digits, digit = divmod(digits, BASE)
+        if digit != NO_CONSTRAINT:
+            cells = frozenset(other for other in range(WINDOW_SIZE)
+                              if unknown & NEIGHBOR_MASKS[pos] & 1 << other)
+            constraints.append((cells, digit - 1))
+
+    cells = sorted(set().union(*(cells for cells, _ in constraints)))
+    size, signature = component_signature(cells, constraints)
+    counts = enumerate_component(size, signature)
+
+    solutions = sum(count for count, _ in counts.values())
+    if not solutions:
+        return (), ()  # Inconsistent, e.g. because of a wrong flag
+    mine_counts = [sum(cell_counts[i] for _, cell_counts in counts.values())
+                   for i in range(len(cells))]
+
+    safe = tuple(cell for cell, count in zip(cells, mine_counts) if count == 0)
+    mines = tuple(cell for cell, count in zip(cells, mine_counts) if count == solutions)
+    return safe, mines
+
+
+class PatternTable:
+    """Lookup table from encoded 5x5 windows to their forced cells.
+
+    Entries are solved on first sight with solve_window and kept, so a shape
+    seen before (1-2-1, 1-2-2-1, corners, ...) costs one encoding and one
+    dictionary lookup. A table can be built ahead of time with build_table,
+    saved and loaded, and shared by any number of solvers.
+    """
+
+    def __init__(self, table=None):
+        """
+        Args:
+            table (dict): Initial entries, mapping window keys to (safe, mines).
+        """
+        self.table = {} if table is None else table
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.table)
+
+    def lookup(self, key):
+        """
+        Forced cells of a window, solving and storing it if it is new.
+
+        Args:
+            key (int): Window code from window_key.
+
+        Returns:
+            tuple: (safe, mines), tuples of window positions.
+        """
+        result = self.table.get(key)
+        if result is None:
+            result = self.table[key] = solve_window(key)
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def save(self, path):
+        """Write the table to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump({str(key): [list(safe), list(mines)]
+                       for key, (safe, mines) in self.table.items()}, f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a table written by save().
+
+        Args:
+            path (str): JSON file.
+
+        Returns:
+            PatternTable: The table.
+        """
+        with open(path) as f:
+            entries = json.load(f)
+        return cls({int(key): (tuple(safe), tuple(mines))
+                    for key, (safe, mines) in entries.items()})
+
+
+def build_table(difficulty='Expert', games=1000, seed=0, table=None):
+    """
+    Fill a pattern table with the windows met while solving seeded games.
+
+    Args:
+        difficulty (str): Key of DIFFICULTY_LEVELS.
+        games (int): Number of games to play.
+        seed (int): Seed of the first game.
+        table (PatternTable): Table to extend (default: a new one).
+
+    Returns:
+        PatternTable: The table.
+    """
+    from minesweeper_solver import SinglePointSolver
+
+    table = PatternTable() if table is None else table
+    level = DIFFICULTY_LEVELS[difficulty]
+    for i in range(games):
+        game = MinesweeperGame(level['rows'], level['cols'], level['mines'], seed=seed + i)
+        game.reveal(game.rng.randrange(game.rows), game.rng.randrange(game.cols))
+        SinglePointSolver(game, patterns=table).solve()
+    return table
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Build a table of 5x5 Minesweeper patterns from seeded games.")
+    parser.add_argument('output', help="JSON file to write")
+    parser.add_argument('-d', '--difficulty', default='Expert',
+                        choices=list(DIFFICULTY_LEVELS),
+                        help="board size and mine count (default: Expert)")
+    parser.add_argument('-n', '--games', type=int, default=1000,
+                        help="number of games (default: 1000)")
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help="seed of the first game (default: 0)")
+    args = parser.parse_args(argv)
+
+    table = build_table(args.difficulty, args.games, args.seed)
+    table.save(args.output)
+    print(f"{len(table)} patterns, {table.hits} hits, {table.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import itertools
+import logging
+import os
+import queue
+import random
+import threading
+from collections import deque
+from multiprocessing import Pool
+
+from minesweeper_game import (DIFFICULTY_LEVELS, MinesweeperGame, board_buffer_from_mines,
+                              place_mines)
+from minesweeper_solver import SinglePointSolver
+
+logger = logging.getLogger(__name__)
+
+
+def generate_no_guess_board(rows, cols, num_mines, seed):
+    """
+    Generate a board the solver finishes from its first click without guessing.
+
+    Candidates are drawn from a random.Random seeded with `seed` and kept only
+    if SinglePointSolver (with the subset stage, without guessing) solves them.
+
+    Args:
+        rows (int): Number of rows in the game board.
+        cols (int): Number of columns in the game board.
+        num_mines (int): Number of mines on the board.
+        seed (int): Seed of the candidate stream.
+
+    Returns:
+        tuple: (board, row, col, attempts): the flat board buffer as bytes, the
+        first click it was solved from and the number of candidates tried.
+    """
+    rng = random.Random(seed)
+    game = MinesweeperGame(rows, cols, num_mines)
+    for attempts in itertools.count(1):
+        row = rng.randrange(rows)
+        col = rng.randrange(cols)
+        board = board_buffer_from_mines(
+            rows, cols, place_mines(rows, cols, num_mines, row, col, rng))
+
+        game.load_board(board, row, col)
+        game.reveal(row, col)
+        if SinglePointSolver(game).solve():
+            return bytes(board), row, col, attempts
+
+
+def generate_task(task):
+    """Pool.map adapter for generate_no_guess_board."""
+    return generate_no_guess_board(*task)
+
+
+def generate_no_guess_boards(difficulty, count, seed=0, workers=None):
+    """
+    Generate no-guess boards across a process pool.
+
+    Board i is generated from seed `seed + i`, so the result does not depend on
+    the number of workers.
+
+    Args:
+        difficulty (str): Key of DIFFICULTY_LEVELS.
+        count (int): Number of boards.
+        seed (int): Seed of the first board.
+        workers (int): Number of worker processes (default: CPU count).
+
+    Returns:
+        list: (board, row, col, attempts) tuples, see generate_no_guess_board.
+    """
+    level = DIFFICULTY_LEVELS[difficulty]
+    tasks = [(level['rows'], level['cols'], level['mines'], seed + i) for i in range(count)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [generate_task(task) for task in tasks]
+    with Pool(workers) as pool:
+        return pool.map(generate_task, tasks, chunksize=max(1, count // (workers * 4)))
+
+
+class BoardPool:
+    """Bounded per-difficulty pools of ready no-guess boards.
+
+    One feeder thread per difficulty keeps its pool topped up by submitting
+    generate_no_guess_board jobs to a shared process pool, never running more
+    jobs than there are free slots. take() never waits: it returns a ready
+    board or None.
+    """
+
+    def __init__(self, difficulties=None, size=4, workers=None, seed=None):
+        """
+        Args:
+            difficulties (list): Keys of DIFFICULTY_LEVELS to keep boards for
+                (default: all).
+            size (int): Ready boards kept per difficulty.
+            workers (int): Generator processes (default: one less than the CPU
+                count, leaving a core to the caller).
+            seed (int): Seed of the first board (default: random).
+        """
+        self.size = size
+        self.closed = False
+        self.seeds = itertools.count(random.getrandbits(32) if seed is None else seed)
+        self.workers = Pool(workers or max(1, (os.cpu_count() or 2) - 1))
+
+        # Ready boards and a "slot freed" event per (rows, cols, mines) shape
+        self.boards = {}
+        self.wanted = {}
+        self.threads = []
+        for difficulty in difficulties or DIFFICULTY_LEVELS:
+            level = DIFFICULTY_LEVELS[difficulty]
+            shape = (level['rows'], level['cols'], level['mines'])
+            self.boards[shape] = queue.Queue(maxsize=size)
+            self.wanted[shape] = threading.Event()
+            thread = threading.Thread(target=self.refill, args=(shape,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def refill(self, shape):
+        """
+        Keep the pool of a shape full; executed in its feeder thread.
+
+        A failed job is logged and replaced, so the thread keeps running.
+
+        Args:
+            shape (tuple): (rows, cols, mines) of the boards.
+        """
+        boards, wanted = self.boards[shape], self.wanted[shape]
+        pending = deque()
+        while not self.closed:
+            while len(pending) + boards.qsize() < self.size:
+                pending.append(self.workers.apply_async(
+                    generate_no_guess_board, shape + (next(self.seeds),)))
+
+            if not pending:
+                # Full: sleep until take() frees a slot
+                wanted.wait(0.5)
+                wanted.clear()
+                continue
+
+            pending[0].wait(0.1)
+            if pending[0].ready() and not self.closed:
+                try:
+                    boards.put(pending.popleft().get())
+                except Exception:
+                    # Drop the job and keep feeding; its slot is refilled by the
+                    # next round, after a pause in case every job fails
+                    logger.exception("no-guess board generation failed for %s", shape)
+                    wanted.wait(1.0)
+
+    def take(self, rows, cols, num_mines):
+        """
+        Take a ready board of the given shape without waiting.
+
+        Args:
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+            num_mines (int): Number of mines on the board.
+
+        Returns:
+            tuple: (board, row, col, attempts) as returned by
+            generate_no_guess_board, or None if no board is ready.
+        """
+        shape = (rows, cols, num_mines)
+        boards = self.boards.get(shape)
+        if boards is None:
+            return None
+        try:
+            board = boards.get_nowait()
+        except queue.Empty:
+            return None
+        self.wanted[shape].set()
+        return board
+
+    def close(self):
+        """Stop the feeder threads and the generator processes."""
+        self.closed = True
+        for event in self.wanted.values():
+            event.set()
+        for thread in self.threads:
+            thread.join()
+        self.workers.terminate()
+        self.workers.join()
@@ -0,0 +1,281 @@
+import time
+from collections import deque
+from fractions import Fraction
+from math import comb
+from operator import add
+
+
+# Results of enumerate_component by signature, least recently used first
+component_cache = {}
+COMPONENT_CACHE_SIZE = 4096
+
+
+def split_components(constraints):
+    """Split frontier constraints into independent connected components.
+
+    Two constraints are connected when they share an unknown cell.
+
+    Args:
+        constraints (dict): Maps a frontier cell to an (unknown, mines) pair, as
+            returned by SinglePointSolver.frontier_constraints.
+
+    Returns:
+        list: One (cells, constraints) pair per component: the sorted list of
+        unknown flat indices and the list of (unknown, mines) constraints.
+    """
+    # Union-find over the unknown cells
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for unknown, _ in constraints.values():
+        cells = iter(unknown)
+        first = next(cells)
+        parent.setdefault(first, first)
+        root = find(first)
+        for cell in cells:
+            parent.setdefault(cell, cell)
+            other = find(cell)
+            if other != root:
+                parent[other] = root
+
+    groups = {}
+    for unknown, mines in constraints.values():
+        groups.setdefault(find(next(iter(unknown))), []).append((unknown, mines))
+
+    components = []
+    for group in groups.values():
+        cells = sorted(set().union(*(unknown for unknown, _ in group)))
+        components.append((cells, group))
+    return components
+
+
+def component_signature(cells, constraints):
+    """Canonical, position-independent form of a component.
+
+    Cells are renumbered by their order on the board, so components with the
+    same constraint structure share a signature wherever they appear.
+
+    Args:
+        cells (list): Sorted flat indices of the component's unknown cells.
+        constraints (list): (unknown, mines) pairs of the component.
+
+    Returns:
+        tuple: (number of cells, sorted tuple of (local cells, mines) pairs).
+    """
+    local = {cell: i for i, cell in enumerate(cells)}
+    return len(cells), tuple(sorted({(tuple(sorted(local[cell] for cell in unknown)), mines)
+                                     for unknown, mines in constraints}))
+
+
+def enumerate_component(size, constraints, deadline=None):
+    """Count the valid mine assignments of a component, grouped by mine total.
+
+    Cells are assigned one at a time in breadth-first order over shared
+    constraints, so each constraint is closed soon after it is opened. A branch
+    is cut as soon as a constraint has too many mines or too few unassigned
+    cells left. Subtrees are memoized on the mine counts of the constraints
+    still open, which keeps long frontiers from blowing up. Results are
+    memoized by signature.
+
+    Args:
+        size (int): Number of cells in the component.
+        constraints (tuple): (local cells, mines) pairs from component_signature.
+        deadline (float): Optional time.perf_counter() value after which the
+            enumeration is abandoned. Cached results are returned regardless.
+
+    Returns:
+        dict: Maps a mine total k to (solutions, per-cell mine counts), where
+        per-cell mine counts is a tuple with, for each cell, the number of
+        solutions with k mines in which that cell holds a mine.
+
+    Raises:
+        TimeoutError: If the deadline passes before the enumeration is done.
+    """
+    cache_key = (size, constraints)
+    # Popping and reinserting a hit keeps the cache in least recently used order
+    cached = component_cache.pop(cache_key, None)
+    if cached is not None:
+        component_cache[cache_key] = cached
+        return cached
+    if deadline is not None and time.perf_counter() > deadline:
+        raise TimeoutError("deadline passed before enumerating a component")
+
+    cell_constraints = [[] for _ in range(size)]
+    for c, (cells, _) in enumerate(constraints):
+        for cell in cells:
+            cell_constraints[cell].append(c)
+
+    # Breadth-first order over cells that share a constraint
+    order = []
+    seen = [False] * size
+    for start in range(size):
+        if seen[start]:
+            continue
+        seen[start] = True
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            order.append(cell)
+            for c in cell_constraints[cell]:
+                for other in constraints[c][0]:
+                    if not seen[other]:
+                        seen[other] = True
+                        queue.append(other)
+
+    ordered_constraints = [cell_constraints[cell] for cell in order]
+    first = [size] * len(constraints)
+    last = [-1] * len(constraints)
+    for pos, cs in enumerate(ordered_constraints):
+        for c in cs:
+            first[c] = min(first[c], pos)
+            last[c] = max(last[c], pos)
+    # Constraints with cells both before and at or after each position
+    open_constraints = [tuple(c for c in range(len(constraints)) if first[c] < pos <= last[c])
+                        for pos in range(size + 1)]
+
+    targets = [mines for _, mines in constraints]
+    placed = [0] * len(constraints)
+    left = [len(cells) for cells, _ in constraints]
+    memo = {}
+
+    def count_from(pos):
+        if pos == size:
+            return {0: (1, ())}
+
+        key = (pos, tuple(placed[c] for c in open_constraints[pos]))
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
+        result = {}
+        for value in (0, 1):
+            feasible = True
+            for c in ordered_constraints[pos]:
+                if placed[c] + value > targets[c] or placed[c] + value + left[c] - 1 < targets[c]:
+                    feasible = False
+                    break
+            if not feasible:
+                continue
+
+            for c in ordered_constraints[pos]:
+                placed[c] += value
+                left[c] -= 1
+
+            for k, (solutions, cell_counts) in count_from(pos + 1).items():
+                cell_counts = (solutions * value,) + cell_counts
+                entry = result.get(k + value)
+                if entry is not None:
+                    solutions += entry[0]
+                    cell_counts = tuple(map(add, cell_counts, entry[1]))
+                result[k + value] = (solutions, cell_counts)
+
+            for c in ordered_constraints[pos]:
+                placed[c] -= value
+                left[c] += 1
+
+        memo[key] = result
+        # Checking the clock on every subtree would cost more than the subtree
+        if deadline is not None and not len(memo) & 1023 and time.perf_counter() > deadline:
+            raise TimeoutError("deadline passed while enumerating a component")
+        return result
+
+    counts = {}
+    for k, (solutions, ordered_counts) in count_from(0).items():
+        cell_counts = [0] * size
+        for pos, count in enumerate(ordered_counts):
+            cell_counts[order[pos]] = count
+        counts[k] = (solutions, tuple(cell_counts))
+
+    component_cache[cache_key] = counts
+    if len(component_cache) > COMPONENT_CACHE_SIZE:
+        del component_cache[next(iter(component_cache))]
+    return counts
+
+
+def convolve(a, b):
+    """Combine two {mine total: weight} distributions of independent parts."""
+    result = {}
+    for i, weight_a in a.items():
+        for j, weight_b in b.items():
+            result[i + j] = result.get(i + j, 0) + weight_a * weight_b
+    return result
+
+
+def mine_probabilities(constraints, mines_remaining, other_cells, deadline=None):
+    """Exact mine probability of every unknown cell.
+
+    Each frontier component is enumerated on its own and the components are
+    combined using the global mine count: a configuration with K frontier
+    mines is weighted by the number of ways to place the remaining mines on
+    the cells away from the frontier.
+
+    Args:
+        constraints (dict): Frontier constraints, see split_components.
+        mines_remaining (int): Mines not yet flagged.
+        other_cells (int): Unknown cells not adjacent to any frontier cell.
+        deadline (float): Optional time.perf_counter() value, see
+            enumerate_component.
+
+    Returns:
+        tuple: (probabilities, other_probability), a dict mapping frontier flat
+        indices to their mine probability and the probability shared by every
+        cell away from the frontier, all as exact Fractions. (None, None) if the
+        constraints admit no solution, e.g. because of a wrong flag.
+
+    Raises:
+        TimeoutError: If the deadline passes during the enumeration.
+    """
+    components = []
+    for cells, group in split_components(constraints):
+        size, signature = component_signature(cells, group)
+        result = enumerate_component(size, signature, deadline)
+        if not result:
+            return None, None
+        components.append((cells, result))
+
+    def ways_outside(k):
+        """Number of ways to place the mines left over by k frontier mines."""
+        rest = mines_remaining - k
+        return comb(other_cells, rest) if 0 <= rest <= other_cells else 0
+
+    distributions = [{k: solutions for k, (solutions, _) in result.items()}
+                     for _, result in components]
+
+    total = {0: 1}
+    for distribution in distributions:
+        total = convolve(total, distribution)
+
+    weight = sum(count * ways_outside(k) for k, count in total.items())
+    if weight == 0:
+        return None, None
+
+    probabilities = {}
+    for c, (cells, result) in enumerate(components):
+        # Distribution of every other component combined
+        rest = {0: 1}
+        for other, distribution in enumerate(distributions):
+            if other != c:
+                rest = convolve(rest, distribution)
+
+        cell_weights = [0] * len(cells)
+        for k, (_, cell_counts) in result.items():
+            outside = sum(count * ways_outside(k + j) for j, count in rest.items())
+            if outside:
+                for i, count in enumerate(cell_counts):
+                    cell_weights[i] += count * outside
+
+        for cell, cell_weight in zip(cells, cell_weights):
+            probabilities[cell] = Fraction(cell_weight, weight)
+
+    other_probability = Fraction(0)
+    if other_cells:
+        expected = sum(count * ways_outside(k) * (mines_remaining - k)
+                       for k, count in total.items())
+        other_probability = Fraction(expected, weight * other_cells)
+
+    return probabilities, other_probability
@@ -0,0 +1,554 @@
+import random
+import time
+from collections import defaultdict, deque, namedtuple
+
+from minesweeper_game import DIFFICULTY_LEVELS, MinesweeperGame
+from minesweeper_patterns import window_key, window_offsets
+from minesweeper_probability import mine_probabilities
+
+
+# A single solver move: action is 'reveal', 'flag' or 'guess'; revealed lists
+# the (row, col) cells opened by the move; probability is the estimated mine
+# probability of a guessed cell and None otherwise
+Move = namedtuple('Move', ['action', 'row', 'col', 'revealed', 'probability'])
+
+
+class SinglePointSolver:
+    """Single Point (SP) strategy solver working on a headless game.
+
+    The solver keeps a worklist of "dirty" frontier cells: revealed numbered
+    cells whose neighbourhood changed since they were last examined, so the
+    work done scales with the frontier instead of the whole board. search()
+    lists the tiers that run when SP stalls.
+    """
+
+    def __init__(self, game, callback=None, use_subsets=True, guess=False, stats=None,
+                 patterns=None, budget=None):
+        """
+        Args:
+            game (MinesweeperGame): Game to solve.
+            callback (callable): Optional callback(move) called by solve() after
+                each Move is applied.
+            use_subsets (bool): Run the pairwise subset stage when SP stalls.
+            guess (bool): When all deduction stalls, use the probability engine
+                and reveal the lowest-risk cell instead of stopping.
+            stats (SolverStats): Optional collector of counters and timers.
+            patterns (PatternTable): Optional table of local patterns, used
+                when SP does not fire.
+            budget (float): Optional time limit per move, in seconds; see
+                moves().
+        """
+        self.game = game
+        self.callback = callback
+        self.use_subsets = use_subsets
+        self.guess = guess
+        self.stats = stats
+        self.patterns = patterns
+        self.budget = budget
+        # time.perf_counter() value by which the next move is due
+        self.deadline = None
+        # (row, col, mine probability) of every guess made by the solver
+        self.guesses = []
+        self.cancelled = False
+        self.queue = deque()
+        self.queued = set()
+        # Revealed numbered cells that still had unprobed neighbors when last seen
+        self.frontier = set()
+
+    def push(self, idx):
+        """
+        Queue a revealed numbered cell for (re)examination.
+
+        Args:
+            idx (int): Flat index of the cell.
+        """
+        game = self.game
+        if idx not in self.queued and game.revealed[idx] and game.board[idx] > 0:
+            self.queued.add(idx)
+            self.queue.append(idx)
+
+    def mark_dirty(self, cells):
+        """
+        Queue the numbered neighbours of cells that were just revealed or flagged.
+
+        Args:
+            cells (list): Flat indices of the changed cells.
+        """
+        offsets = self.game.offsets
+        for idx in cells:
+            for offset in offsets:
+                self.push(idx + offset)
+
+    def reveal_move(self, idx, action='reveal', probability=None):
+        """
+        Reveal a cell and describe it as a Move.
+
+        Args:
+            idx (int): Flat index of the cell.
+            action (str): 'reveal' for a deduced safe cell, 'guess' otherwise.
+            probability (float): Mine probability of a guessed cell.
+
+        Returns:
+            Move: The applied move.
+        """
+        game = self.game
+        revealed = game.reveal_index(idx)
+        self.mark_dirty(revealed)
+        if self.stats is not None:
+            self.stats.count('guesses' if action == 'guess' else 'reveals')
+            self.stats.count('neighbor_lookups', len(game.offsets) * len(revealed))
+            self.stats.flood_fill_sizes[len(revealed)] += 1
+        row, col = game.position(idx)
+        return Move(action, row, col, [game.position(i) for i in revealed], probability)
+
+    def flag_move(self, idx):
+        """
+        Flag a cell and describe it as a Move.
+
+        Args:
+            idx (int): Flat index of the cell.
+
+        Returns:
+            Move: The applied move.
+        """
+        game = self.game
+        game.toggle_flag_index(idx)
+        self.mark_dirty((idx,))
+        if self.stats is not None:
+            self.stats.count('flags')
+            self.stats.count('neighbor_lookups', len(game.offsets))
+        row, col = game.position(idx)
+        return Move('flag', row, col, [], None)
+
+    def moves(self):
+        """
+        Solve the game step by step, yielding each Move as it is applied.
+
+        Moves are applied to the game just before they are yielded, and nothing
+        is deduced ahead of the consumer.
+
+        With a budget, each move must be decided within `budget` seconds of the
+        consumer asking for it. SP always runs; the subset and probability
+        tiers only start while budget is left and give up when it runs out. A
+        guessing solver then reveals the cell with the lowest local mine
+        density instead, so it always moves; without guessing it stops as on a
+        stall.
+
+        Yields:
+            Move: The next reveal, flag or guess.
+        """
+        if self.budget is None:
+            yield from self.search()
+            return
+
+        stats = self.stats
+        start = time.perf_counter()
+        self.deadline = start + self.budget
+        for move in self.search():
+            if stats is not None and time.perf_counter() - start > self.budget:
+                stats.count('moves_over_budget')
+            yield move
+            start = time.perf_counter()
+            self.deadline = start + self.budget
+
+    def time_left(self):
+        """bool: True unless the budget of the current move is spent."""
+        return self.deadline is None or time.perf_counter() < self.deadline
+
+    def search(self):
+        """
+        Run the solver's tiers, yielding each Move as it is applied.
+
+        The worklist is seeded with every revealed numbered cell, then cells are
+        taken from it until no dirty frontier cell is left. If the game is not
+        won by then, the subset stage compares overlapping pairs of frontier
+        cells, and with guessing the probability stage (see
+        minesweeper_probability) applies the cells it proves safe or mined or
+        reveals the lowest-risk cell. SP picks up any cells they changed.
+        Stopping the iteration early leaves the game in the state of the last
+        yielded move.
+
+        Yields:
+            Move: The next reveal, flag or guess.
+        """
+        game = self.game
+        stats = self.stats
+        self.queue.clear()
+        self.queued.clear()
+        self.frontier.clear()
+        self.guesses = []
+
+        for idx in game.revealed_indices():
+            self.push(idx)
+
+        while not game.lost:
+            if stats is not None:
+                stats.count('passes')
+
+            while self.queue and not game.lost and not self.cancelled:
+                idx = self.queue.popleft()
+                self.queued.discard(idx)
+                if stats is not None:
+                    stats.count('cells_scanned')
+
+                if game.unrevealed_neighbors[idx] == game.flagged_neighbors[idx]:
+                    self.frontier.discard(idx)
+                    continue  # No unprobed neighbors left
+
+                # Apply SP strategy
+                yield from self.stage('single_point', self.apply_single_point_strategy(idx))
+
+                if game.unrevealed_neighbors[idx] > game.flagged_neighbors[idx]:
+                    self.frontier.add(idx)
+                else:
+                    self.frontier.discard(idx)
+
+            if game.lost or game.check_win() or self.cancelled:
+                break
+
+            # SP stalled: fall back to pairwise constraints on the frontier
+            if self.use_subsets and self.time_left() and (
+                    yield from self.stage('subsets', self.apply_subset_strategy())):
+                continue
+
+            if self.cancelled or not self.guess:
+                break
+            progress = None
+            if self.time_left():
+                progress = yield from self.stage('probability', self.apply_probability_strategy())
+            if progress is None:
+                # Out of budget: guess from local densities instead
+                progress = yield from self.stage('estimate', self.apply_estimate_strategy())
+            if not progress:
+                break
+
+    def stage(self, name, moves):
+        """
+        Time a strategy generator under the given name when stats are enabled.
+
+        Args:
+            name (str): Timer name.
+            moves (generator): The strategy's generator.
+
+        Returns:
+            generator: The generator, wrapped if stats are enabled.
+        """
+        return moves if self.stats is None else self.stats.timed(name, moves)
+
+    def solve(self):
+        """
+        Solve the game using the Single Point (SP) strategy
+
+        Runs moves() to the end, passing each move to the callback.
+
+        Returns:
+            bool: True if the puzzle was solved, False otherwise.
+        """
+        callback = self.callback
+        for move in self.stage('solve', self.moves()):
+            if callback is not None:
+                callback(move)
+
+        return self.game.check_win()
+
+    def cancel(self):
+        """
+        Ask a running solve() to stop after the current step.
+
+        Safe to call from another thread.
+        """
+        self.cancelled = True
+
+    def apply_single_point_strategy(self, idx):
+        """
+        Apply the Single Point (SP) strategy to the specified cell
+
+        Args:
+            idx (int): Flat index of the cell (see MinesweeperGame.index).
+
+        Yields:
+            Move: Each reveal or flag deduced from the cell.
+        """
+        game = self.game
+        stats = self.stats
+
+        unrevealed_neighbors = game.unrevealed_neighbors[idx]
+        flagged_neighbors = game.flagged_neighbors[idx]
+        cell_value = game.board[idx]
+        remaining_unrevealed_neighbors = unrevealed_neighbors - flagged_neighbors
+
+        # Scenario 1: Deduce safe cells
+        if flagged_neighbors == cell_value:
+            if stats is not None:
+                stats.count('sp_safe')
+                stats.count('neighbor_lookups', len(game.offsets))
+            # All unrevealed neighbors are safe to reveal
+            for offset in game.offsets:
+                neighbor = idx + offset
+                if not game.revealed[neighbor] and not game.flags[neighbor]:
+                    yield self.reveal_move(neighbor)
+
+        # Scenario 2: Deduce and flag mines
+        elif remaining_unrevealed_neighbors == cell_value - flagged_neighbors:
+            if stats is not None:
+                stats.count('sp_mine')
+                stats.count('neighbor_lookups', len(game.offsets))
+            # If the number of remaining mines equals the number of unrevealed neighbors,
+            # flag all unrevealed neighbors as mines.
+            for offset in game.offsets:
+                neighbor = idx + offset
+                if not game.revealed[neighbor] and not game.flags[neighbor]:
+                    yield self.flag_move(neighbor)
+
+        # Otherwise match the 5x5 window against the pattern table
+        elif self.patterns is not None:
+            if stats is not None:
+                stats.count('pattern_lookups')
+                stats.count('neighbor_lookups', len(game.offsets))
+            yield from self.apply_pattern_strategy(idx)
+
+    def apply_pattern_strategy(self, idx):
+        """
+        Apply the cells forced by the 5x5 window around the specified cell.
+
+        Used when neither SP rule fires on the cell. The table (see
+        minesweeper_patterns) resolves shapes such as 1-2-1 without waiting
+        for the subset stage.
+
+        Args:
+            idx (int): Flat index of the cell.
+
+        Yields:
+            Move: Each reveal or flag from the pattern table.
+        """
+        game = self.game
+        key = window_key(game, idx)
+        if key is None:
+            return
+        safe, mines = self.patterns.lookup(key)
+        offsets = window_offsets(game.cols)
+
+        for pos in mines:
+            cell = idx + offsets[pos]
+            if not game.revealed[cell] and not game.flags[cell]:
+                yield self.flag_move(cell)
+        for pos in safe:
+            cell = idx + offsets[pos]
+            if not game.revealed[cell] and not game.flags[cell]:
+                yield self.reveal_move(cell)
+
+    def frontier_constraints(self):
+        """
+        Build the constraint of every cell on the stalled frontier.
+
+        Returns:
+            dict: Maps a frontier cell's flat index to a (unknown, mines) pair:
+            the frozenset of its unprobed neighbors and the number of mines
+            among them.
+        """
+        game = self.game
+        board, revealed, flags, offsets = game.board, game.revealed, game.flags, game.offsets
+
+        constraints = {}
+        for idx in list(self.frontier):
+            unknown = frozenset(idx + offset for offset in offsets
+                                if not revealed[idx + offset] and not flags[idx + offset])
+            if not unknown:
+                self.frontier.discard(idx)
+                continue
+            constraints[idx] = (unknown, board[idx] - game.flagged_neighbors[idx])
+        return constraints
+
+    def apply_subset_strategy(self):
+        """
+        Compare the constraints of overlapping pairs of frontier cells.
+
+        For cells A and B with unknown neighbor sets U_A, U_B and remaining mine
+        counts M_A, M_B: if M_A - M_B equals |U_A - U_B|, every cell only next to
+        A is a mine and every cell only next to B is safe. Taken over all
+        ordered pairs this includes the subset rule (U_A inside U_B).
+
+        Yields:
+            Move: Each reveal or flag deduced.
+
+        Returns:
+            bool: True if any cell was revealed or flagged.
+        """
+        game = self.game
+        constraints = self.frontier_constraints()
+
+        # Index the constraints by cell so only overlapping pairs are compared
+        constraints_by_cell = defaultdict(list)
+        for idx, (unknown, _) in constraints.items():
+            for cell in unknown:
+                constraints_by_cell[cell].append(idx)
+
+        progress = False
+        for a, (unknown_a, mines_a) in constraints.items():
+            if not self.time_left():
+                if self.stats is not None:
+                    self.stats.count('budget_exhausted_subsets')
+                break
+            partners = {b for cell in unknown_a for b in constraints_by_cell[cell] if b != a}
+            if self.stats is not None:
+                self.stats.count('subset_pairs', len(partners))
+            for b in partners:
+                unknown_b, mines_b = constraints[b]
+                only_a = unknown_a - unknown_b
+                if mines_a - mines_b != len(only_a):
+                    continue
+
+                # Constraints stay true as cells change, so earlier moves in this
+                # pass never invalidate a deduction; just skip cells already done
+                for cell in only_a:
+                    if not game.revealed[cell] and not game.flags[cell]:
+                        progress = True
+                        yield self.flag_move(cell)
+                for cell in unknown_b - unknown_a:
+                    if not game.revealed[cell] and not game.flags[cell]:
+                        progress = True
+                        yield self.reveal_move(cell)
+                        if game.lost:
+                            return True
+
+        return progress
+
+    def apply_probability_strategy(self):
+        """
+        Use exact mine probabilities once every deduction rule has stalled.
+
+        Cells with probability 0 are revealed and cells with probability 1 are
+        flagged. If there are none, the cell with the lowest probability is
+        revealed as a guess, preferring a corner among equally risky cells away
+        from the frontier.
+
+        Yields:
+            Move: Each reveal or flag proven by the probabilities, or one guess.
+
+        Returns:
+            bool: True if any cell was revealed or flagged, None if the budget
+            ran out before the probabilities were known.
+        """
+        game = self.game
+        constraints = self.frontier_constraints()
+        frontier_cells = set().union(*(unknown for unknown, _ in constraints.values()))
+        other_cells = game.unrevealed_count - len(frontier_cells)
+
+        if self.stats is not None:
+            self.stats.count('probability_runs')
+        try:
+            probabilities, other_probability = mine_probabilities(
+                constraints, game.mines_remaining, other_cells, self.deadline)
+        except TimeoutError:
+            if self.stats is not None:
+                self.stats.count('budget_exhausted_probability')
+            return None
+        if probabilities is None:
+            return False
+
+        certain = sorted(cell for cell, p in probabilities.items() if p in (0, 1))
+        if other_cells and other_probability in (0, 1):
+            certain.extend(set(self.other_unknown_cells(frontier_cells)))
+
+        if certain:
+            for cell in certain:
+                if game.revealed[cell] or game.flags[cell]:
+                    continue
+                if probabilities.get(cell, other_probability) == 1:
+                    yield self.flag_move(cell)
+                else:
+                    yield self.reveal_move(cell)
+                    if game.lost:
+                        break
+            return True
+
+        # No certain cell: reveal the lowest-risk one
+        candidates = [(p, cell) for cell, p in probabilities.items()]
+        if other_cells:
+            candidates.append((other_probability, next(self.other_unknown_cells(frontier_cells))))
+        if not candidates:
+            return False
+
+        probability, cell = min(candidates)
+        move = self.reveal_move(cell, 'guess', float(probability))
+        self.guesses.append((move.row, move.col, move.probability))
+        yield move
+        return True
+
+    def apply_estimate_strategy(self):
+        """
+        Guess from local mine densities, for when there is no time for exact
+        probabilities.
+
+        A frontier cell is rated with the highest ratio of mines left to unknown
+        cells among the constraints it belongs to, and every other cell with
+        the density of the remaining mines over all unknown cells. The lowest
+        rated cell is revealed as a guess.
+
+        Yields:
+            Move: The guess.
+
+        Returns:
+            bool: True if a cell was revealed.
+        """
+        game = self.game
+        risks = {}
+        for unknown, mines in self.frontier_constraints().values():
+            risk = mines / len(unknown)
+            for cell in unknown:
+                if risk > risks.get(cell, -1):
+                    risks[cell] = risk
+
+        candidates = [(risk, cell) for cell, risk in risks.items()]
+        if game.unrevealed_count > len(risks):
+            candidates.append((game.mines_remaining / game.unrevealed_count,
+                               next(self.other_unknown_cells(risks))))
+        if not candidates:
+            return False
+
+        if self.stats is not None:
+            self.stats.count('estimate_guesses')
+        risk, cell = min(candidates)
+        move = self.reveal_move(cell, 'guess', risk)
+        self.guesses.append((move.row, move.col, move.probability))
+        yield move
+        return True
+
+    def other_unknown_cells(self, frontier_cells):
+        """
+        Iterate over the unknown cells away from the frontier, corners first.
+
+        Args:
+            frontier_cells (set): Flat indices of the unknown frontier cells.
+
+        Yields:
+            int: Flat index of each cell (corners may come twice).
+        """
+        game = self.game
+        corners = [game.index(row, col)
+                   for row in (0, game.rows - 1) for col in (0, game.cols - 1)]
+        for idx in corners + list(game.indices()):
+            if not game.revealed[idx] and not game.flags[idx] and idx not in frontier_cells:
+                yield idx
+
+
+def play_game(difficulty='Beginner', guess=False):
+    """
+    Play one headless game: random first click, then the SP solver.
+
+    Args:
+        difficulty (str): Key of DIFFICULTY_LEVELS.
+        guess (bool): Let the solver guess when deduction stalls.
+
+    Returns:
+        tuple: The finished MinesweeperGame and True if it was solved.
+    """
+    level = DIFFICULTY_LEVELS[difficulty]
+    game = MinesweeperGame(level['rows'], level['cols'], level['mines'])
+
+    # Randomly select a cell to click
+    game.reveal(random.randint(0, game.rows - 1),
+                random.randint(0, game.cols - 1))
+
+    solved = SinglePointSolver(game, guess=guess).solve()
+    return game, solved
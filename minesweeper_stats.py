@@ -0,0 +1,145 @@
+import cProfile
+import json
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+class SolverStats:
+    """Counters and timers filled in by the solver and the GUI.
+
+    Pass an instance as `stats` to SinglePointSolver or MinesweeperGUI. Every
+    hook is skipped when no stats object is given, so the solver pays nothing
+    for them by default. One instance can collect several games.
+
+    Counters:
+        passes: Rounds of the main loop (SP drain, then the fallback stages).
+        cells_scanned: Frontier cells taken from the worklist.
+        sp_safe, sp_mine: Cells where SP scenario 1 (all neighbors safe) or
+            scenario 2 (all neighbors mines) fired.
+        neighbor_lookups: Neighbor cells visited by SP and by the worklist
+            updates after each move.
+        subset_pairs, probability_runs: Constraint pairs compared by the
+            subset stage, and runs of the probability engine.
+        reveals, flags, guesses: Moves made.
+        pattern_lookups: Cells matched against the pattern table.
+        budget_exhausted_subsets, budget_exhausted_probability: Times a tier
+            gave up because the move's time budget ran out.
+        estimate_guesses: Guesses made from local densities instead.
+        moves_over_budget: Moves decided later than the budget allowed (SP
+            itself is never interrupted).
+
+    Timers (seconds) are inclusive: 'solve' covers every stage under it. The
+    stages are 'single_point', 'subsets', 'probability' and 'estimate'.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.timers = defaultdict(float)
+        # Number of reveals opening n cells, by n
+        self.flood_fill_sizes = Counter()
+
+    def count(self, name, n=1):
+        """Add n to a counter."""
+        self.counters[name] += n
+
+    @contextmanager
+    def timer(self, name):
+        """Context manager adding the time spent in its block to a timer."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def timed(self, name, moves):
+        """
+        Wrap a generator, adding the time spent inside it to a timer.
+
+        Only the time spent producing items is counted, not the time the
+        consumer holds each item. The generator's return value is passed on.
+
+        Args:
+            name (str): Timer name.
+            moves (generator): Generator to wrap.
+
+        Returns:
+            generator: The wrapped generator.
+        """
+        timers = self.timers
+        while True:
+            start = time.perf_counter()
+            try:
+                move = next(moves)
+            except StopIteration as stop:
+                timers[name] += time.perf_counter() - start
+                return stop.value
+            timers[name] += time.perf_counter() - start
+            yield move
+
+    def merge(self, other):
+        """
+        Add the counts and times of another collection.
+
+        Args:
+            other (SolverStats or dict): Stats object or its as_dict() form.
+        """
+        if isinstance(other, dict):
+            self.counters.update(other['counters'])
+            for name, seconds in other['timers_s'].items():
+                self.timers[name] += seconds
+            self.flood_fill_sizes.update({int(size): n for size, n
+                                          in other['flood_fill_sizes'].items()})
+        else:
+            self.counters.update(other.counters)
+            for name, seconds in other.timers.items():
+                self.timers[name] += seconds
+            self.flood_fill_sizes.update(other.flood_fill_sizes)
+
+    def as_dict(self):
+        """
+        JSON-serializable form of the collected stats.
+
+        Returns:
+            dict: counters, timers_s, flood_fill_sizes (a histogram keyed by
+            size) and a flood_fill summary.
+        """
+        reveals = sum(self.flood_fill_sizes.values())
+        cells = sum(size * n for size, n in self.flood_fill_sizes.items())
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'timers_s': dict(sorted(self.timers.items())),
+            'flood_fill_sizes': {str(size): n for size, n in sorted(self.flood_fill_sizes.items())},
+            'flood_fill': {
+                'reveals': reveals,
+                'cells': cells,
+                'mean': cells / reveals if reveals else 0.0,
+                'max': max(self.flood_fill_sizes, default=0),
+            },
+        }
+
+    def dump_json(self, path):
+        """Write as_dict() to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+
+def profile(path, function, *args, **kwargs):
+    """
+    Run a function under cProfile and write the profile to a file.
+
+    The file can be read with pstats or any tool that accepts cProfile output.
+
+    Args:
+        path (str): Output file.
+        function (callable): Function to profile, called with the remaining
+            arguments.
+
+    Returns:
+        The function's return value.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
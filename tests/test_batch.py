@@ -0,0 +1,106 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from minesweeper_batch import (BatchSolver, add_planes, corpus_mines, equal_planes,
+                               pack_boards, random_mines, unpack_boards, window_any,
+                               window_count, window_sum)
+from minesweeper_benchmark import run_batch_benchmark
+from minesweeper_corpus import BoardCorpus, write_corpus
+from minesweeper_game import MinesweeperGame, board_buffer_from_mines
+from minesweeper_solver import SinglePointSolver
+
+
+def random_cells(boards=100, rows=7, cols=9, seed=0):
+    return np.random.default_rng(seed).random((boards, rows, cols)) < 0.4
+
+
+def plane_values(planes, boards):
+    """Decode bit planes of packed boards into a (boards, rows, cols) int array."""
+    return sum(unpack_boards(plane, boards).astype(int) << i for i, plane in enumerate(planes))
+
+
+def direct_window_sum(cells):
+    padded = np.pad(cells.astype(int), ((0, 0), (1, 1), (1, 1)))
+    rows, cols = cells.shape[1:]
+    return sum(padded[:, di:di + rows, dj:dj + cols] for di in range(3) for dj in range(3))
+
+
+def test_pack_round_trip():
+    cells = random_cells(boards=130)
+    assert (unpack_boards(pack_boards(cells), 130) == cells).all()
+
+
+def test_window_sums():
+    cells = random_cells()
+    expected = direct_window_sum(cells)
+    assert (window_sum(cells) == expected).all()
+    assert (window_any(cells) == (expected > 0)).all()
+    assert (plane_values(window_count(pack_boards(cells)), 100) == expected).all()
+
+
+def test_add_and_compare_planes():
+    rng = np.random.default_rng(1)
+    x = rng.integers(0, 16, (100, 4, 5))
+    y = rng.integers(0, 4, (100, 4, 5))
+    x_planes = [pack_boards(x & (1 << bit) > 0) for bit in range(4)]
+    y_planes = [pack_boards(y & (1 << bit) > 0) for bit in range(2)]
+
+    assert (plane_values(add_planes(x_planes, y_planes), 100) == x + y).all()
+    assert (unpack_boards(equal_planes(x_planes, y_planes), 100) == (x == y)).all()
+
+
+@pytest.mark.parametrize('rows, cols, num_mines', [(9, 9, 10), (16, 16, 40), (16, 30, 99)])
+def test_batch_matches_single_point_solver(rows, cols, num_mines):
+    mines, clicks = random_mines(rows, cols, num_mines, 150, seed=3)
+    solver = BatchSolver(mines, clicks)
+    solver.solve(chunk_size=64)
+
+    for i in range(len(mines)):
+        game = MinesweeperGame(rows, cols, num_mines)
+        positions = np.flatnonzero(mines[i]).tolist()
+        game.load_board(board_buffer_from_mines(rows, cols, positions), *clicks[i])
+        game.reveal(*clicks[i])
+        SinglePointSolver(game, use_subsets=False).solve()
+
+        revealed = np.array([[game.is_revealed(r, c) for c in range(cols)] for r in range(rows)])
+        flagged = np.array([[game.is_flagged(r, c) for c in range(cols)] for r in range(rows)])
+        assert (solver.revealed[i] == revealed).all()
+        assert (solver.flagged[i] == flagged).all()
+
+
+def test_random_mines_keep_first_click_safe():
+    mines, clicks = random_mines(16, 30, 99, 5000, seed=4)
+    assert (mines.sum(axis=(1, 2)) == 99).all()
+    near = window_any(mines)
+    assert not near[np.arange(len(mines)), clicks[:, 0], clicks[:, 1]].any()
+
+
+def test_corpus_mines_match_records(tmp_path):
+    path = tmp_path / 'corpus.bin'
+    write_corpus(path, 16, 30, 99, 20, seed=5)
+    with BoardCorpus(path) as corpus:
+        mines, clicks = corpus_mines(corpus, 3, 17)
+        assert mines.shape == (14, 16, 30)
+        for i in range(3, 17):
+            row, col, mask = corpus.record(i)
+            mask.release()
+            expected = np.zeros((16, 30), dtype=bool)
+            for r, c in corpus.game(i).mine_positions():
+                expected[r, c] = True
+            assert tuple(clicks[i - 3]) == (row, col)
+            assert (mines[i - 3] == expected).all()
+
+
+def test_batch_benchmark_reads_corpus(tmp_path):
+    path = tmp_path / 'corpus.bin'
+    write_corpus(path, 9, 9, 10, 50, seed=6)
+    report = run_batch_benchmark(None, None, corpus=str(path))
+    result = report['results']['Beginner']
+
+    with BoardCorpus(path) as corpus:
+        wins = 0
+        for i in range(len(corpus)):
+            game = corpus.game(i)
+            wins += SinglePointSolver(game, use_subsets=False).solve()
+    assert (result['games'], result['wins']) == (50, wins)
@@ -0,0 +1,50 @@
+import pytest
+
+from minesweeper_corpus import BoardCorpus, write_corpus
+from minesweeper_game import DIFFICULTY_LEVELS, MinesweeperGame
+
+
+@pytest.mark.parametrize('difficulty', list(DIFFICULTY_LEVELS))
+@pytest.mark.parametrize('seed', [0, 1, 12345])
+def test_first_board_matches_seeded_game(tmp_path, difficulty, seed):
+    level = DIFFICULTY_LEVELS[difficulty]
+    rows, cols, num_mines = level['rows'], level['cols'], level['mines']
+    path = tmp_path / 'corpus.bin'
+    write_corpus(path, rows, cols, num_mines, 3, seed=seed)
+
+    game = MinesweeperGame(rows, cols, num_mines, seed=seed)
+    row = game.rng.randrange(rows)
+    col = game.rng.randrange(cols)
+    game.reveal(row, col)
+
+    with BoardCorpus(path) as corpus:
+        assert (len(corpus), corpus.difficulty) == (3, difficulty)
+        loaded = corpus.game(0)
+    assert (loaded.initial_click_row, loaded.initial_click_col) == (row, col)
+    assert bytes(loaded.board) == bytes(game.board)
+    assert bytes(loaded.revealed) == bytes(game.revealed)
+
+
+def test_boards_differ(tmp_path):
+    path = tmp_path / 'corpus.bin'
+    write_corpus(path, 16, 30, 99, 2, seed=0)
+    with BoardCorpus(path) as corpus:
+        first, second = corpus.board(0)[0], corpus.board(1)[0]
+    assert bytes(first) != bytes(second)
+
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / 'corpus.bin'
+    write_corpus(path, 16, 30, 99, 4, seed=0)
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        BoardCorpus(path)
+
+
+@pytest.mark.parametrize('data', [b'MSBC', b'MSML' + bytes(40)])
+def test_foreign_file_raises(tmp_path, data):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        BoardCorpus(path)
@@ -0,0 +1,75 @@
+import pytest
+
+import minesweeper_infinite
+from minesweeper_game import MinesweeperGame, board_buffer_from_mines
+from minesweeper_infinite import ChunkedGrid, InfiniteGame, cell_hash
+from minesweeper_solver import SinglePointSolver
+
+ROWS, COLS = 70, 150  # Several chunks, with partial chunks on the edges
+
+
+def dense_twin(game):
+    """Dense MinesweeperGame with the same mines and first click as an InfiniteGame."""
+    row0, col0 = game.initial_click_row, game.initial_click_col
+    mines = [row * game.cols + col for row in range(game.rows) for col in range(game.cols)
+             if cell_hash(game.seed, row, col) < game.threshold
+             and not (abs(row - row0) <= 1 and abs(col - col0) <= 1)]
+    dense = MinesweeperGame(game.rows, game.cols, len(mines))
+    dense.load_board(board_buffer_from_mines(game.rows, game.cols, mines), row0, col0)
+    dense.reveal(row0, col0)
+    return dense
+
+
+def cell_states(game):
+    return [(game.is_revealed(row, col), game.is_flagged(row, col))
+            for row in range(game.rows) for col in range(game.cols)]
+
+
+@pytest.mark.parametrize('seed', range(12))
+def test_matches_dense_game(seed):
+    game = InfiniteGame(ROWS, COLS, density=0.12, seed=seed)
+    game.reveal(seed * 5 % ROWS, seed * 11 % COLS)
+    dense = dense_twin(game)
+
+    SinglePointSolver(game).solve()
+    SinglePointSolver(dense).solve()
+
+    assert cell_states(game) == cell_states(dense)
+    assert (game.revealed_count, game.flag_count, game.lost) == \
+        (dense.revealed_count, dense.flag_count, dense.lost)
+
+
+def test_pure_python_chunks_match_numpy(monkeypatch):
+    pytest.importorskip('numpy')
+    game = InfiniteGame(ROWS, COLS, seed=3)
+    game.reveal(10, 20)
+    with_numpy = [game.board[game.index(row, col)] for row in range(ROWS) for col in range(COLS)]
+
+    monkeypatch.setattr(minesweeper_infinite, 'np', None)
+    game = InfiniteGame(ROWS, COLS, seed=3)
+    game.reveal(10, 20)
+    assert [game.board[game.index(row, col)]
+            for row in range(ROWS) for col in range(COLS)] == with_numpy
+
+
+def test_copy_is_independent():
+    game = InfiniteGame(seed=1)
+    game.reveal(500_000, 500_000)
+    before = (game.revealed_count, game.touched_chunks)
+
+    other = game.copy()
+    SinglePointSolver(other).moves().__next__()
+    assert other.revealed_count > before[0] or other.flag_count
+    assert (game.revealed_count, game.touched_chunks) == before
+
+
+def test_whole_board_operations_are_refused():
+    game = InfiniteGame(seed=1)
+    game.reveal(10, 10)
+    with pytest.raises(TypeError):
+        bytes(game.revealed)
+    with pytest.raises(TypeError):
+        iter(ChunkedGrid(10, lambda row0, col0: bytearray(64 * 64)))
+    for operation in (game.snapshot, game.mine_positions, game.indices):
+        with pytest.raises(NotImplementedError):
+            operation()
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from minesweeper_game import MinesweeperGame
+from minesweeper_infinite import InfiniteGame
+from minesweeper_solver import SinglePointSolver
+
+
+def state(game):
+    return (bytes(game.revealed), bytes(game.flags), bytes(game.unrevealed_neighbors),
+            bytes(game.flagged_neighbors), game.revealed_count, game.flag_count, game.lost)
+
+
+def random_moves(game, rng, count):
+    for _ in range(count):
+        game.apply_move(rng.choice(['reveal', 'flag', 'guess']),
+                        rng.randrange(game.rows), rng.randrange(game.cols))
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_rollback_restores_state(seed):
+    rng = random.Random(seed)
+    game = MinesweeperGame(16, 30, 99, seed=seed)
+    game.reveal(rng.randrange(16), rng.randrange(30))
+    start = state(game)
+
+    outer = game.checkpoint()
+    random_moves(game, rng, rng.randrange(20))
+    middle = state(game)
+
+    with game.trial():
+        random_moves(game, rng, rng.randrange(20))
+    assert state(game) == middle
+
+    inner = game.checkpoint()
+    SinglePointSolver(game, guess=True).solve()
+    game.commit(inner)
+
+    game.rollback(outer)
+    assert state(game) == start
+    assert game.journal is None
+
+
+def test_rolled_back_game_solves_like_a_fresh_one():
+    game = MinesweeperGame(16, 30, 99, seed=7)
+    game.reveal(8, 15)
+    fresh = game.copy()
+
+    with game.trial():
+        SinglePointSolver(game, guess=True).solve()
+    SinglePointSolver(game).solve()
+    SinglePointSolver(fresh).solve()
+    assert state(game) == state(fresh)
+
+
+def test_checkpoints_close_innermost_first():
+    game = MinesweeperGame(9, 9, 10, seed=1)
+    game.reveal(4, 4)
+    outer = game.checkpoint()
+    inner = game.checkpoint()
+
+    with pytest.raises(ValueError):
+        game.rollback(outer)
+    with pytest.raises(ValueError):
+        game.commit(outer)
+
+    game.rollback(inner)
+    game.commit(outer)
+    assert game.journal is None
+    with pytest.raises(ValueError):
+        game.commit(outer)
+
+
+def test_checkpoint_needs_a_started_game():
+    with pytest.raises(ValueError):
+        MinesweeperGame(9, 9, 10).checkpoint()
+
+
+def test_infinite_game_rollback():
+    game = InfiniteGame(seed=2)
+    game.reveal(500_000, 500_000)
+    counts = (game.revealed_count, game.flag_count)
+    revealed = sorted(game.revealed_indices())
+
+    with game.trial():
+        moves = SinglePointSolver(game).moves()
+        for _ in range(200):
+            next(moves)
+    assert (game.revealed_count, game.flag_count) == counts
+    assert sorted(game.revealed_indices()) == revealed
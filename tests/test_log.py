@@ -0,0 +1,85 @@
+import pytest
+
+from minesweeper_corpus import mask_size
+from minesweeper_game import MinesweeperGame
+from minesweeper_log import (MoveLog, first_difference, read_logs, replay, rerun,
+                             write_logs)
+from minesweeper_solver import SinglePointSolver
+
+
+def recorded_game(seed, rows=16, cols=30, num_mines=99):
+    game = MinesweeperGame(rows, cols, num_mines, seed=seed)
+    game.reveal(rows // 2, cols // 2)
+    log = MoveLog.start(game)
+    SinglePointSolver(game, guess=True, callback=log.record_move).solve()
+    return game, log
+
+
+def moves(log):
+    return [move[:3] for move in log.moves()]
+
+
+def test_bytes_round_trip():
+    _, log = recorded_game(1)
+    copy, offset = MoveLog.from_bytes(log.to_bytes())
+    assert offset == len(log.to_bytes())
+    assert (copy.rows, copy.cols, copy.num_mines) == (log.rows, log.cols, log.num_mines)
+    assert (copy.row, copy.col, copy.mask) == (log.row, log.col, log.mask)
+    assert list(copy.moves()) == list(log.moves())
+
+
+def test_large_board_round_trip():
+    log = MoveLog(1000, 1000, 150000, bytes(mask_size(1000, 1000)), 3, 4)
+    log.record('reveal', 999, 999)
+    copy, _ = MoveLog.from_bytes(log.to_bytes())
+    assert copy.num_mines == 150000
+    assert moves(copy) == [('reveal', 999, 999)]
+
+
+def test_read_logs_reads_every_log(tmp_path):
+    logs = [recorded_game(seed)[1] for seed in range(5)]
+    path = tmp_path / 'games.mslog'
+    write_logs(path, logs)
+    read = read_logs(path)
+    assert len(read) == len(logs)
+    for copy, log in zip(read, logs):
+        assert copy.mask == log.mask
+        assert list(copy.moves()) == list(log.moves())
+
+
+@pytest.mark.parametrize('data', [b'', b'MSML', b'XXXX' + bytes(20)])
+def test_bad_data_raises(data):
+    with pytest.raises(ValueError):
+        MoveLog.from_bytes(data)
+
+
+def test_truncated_log_raises():
+    data = recorded_game(2)[1].to_bytes()
+    with pytest.raises(ValueError):
+        MoveLog.from_bytes(data[:-1])
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_replay_matches_recorded_game(seed):
+    game, log = recorded_game(seed)
+    replayed = replay(log)
+    assert bytes(replayed.revealed) == bytes(game.revealed)
+    assert bytes(replayed.flags) == bytes(game.flags)
+    assert replayed.lost == game.lost
+
+
+def test_first_difference():
+    _, log = recorded_game(3)
+    assert first_difference(log, rerun(log, guess=True)) is None
+
+    changed = MoveLog(log.rows, log.cols, log.num_mines, log.mask, log.row, log.col)
+    for i, (action, row, col) in enumerate(moves(log)):
+        if i == 5:
+            action = 'flag' if action != 'flag' else 'reveal'
+        changed.record(action, row, col)
+    assert first_difference(log, changed) == 5
+
+    shorter = MoveLog(log.rows, log.cols, log.num_mines, log.mask, log.row, log.col)
+    for action, row, col in moves(log)[:-1]:
+        shorter.record(action, row, col)
+    assert first_difference(log, shorter) == len(log) - 1
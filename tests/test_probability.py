@@ -0,0 +1,57 @@
+import itertools
+import random
+from fractions import Fraction
+
+import pytest
+
+from minesweeper_game import MINE_VALUE, MinesweeperGame
+from minesweeper_probability import mine_probabilities
+from minesweeper_solver import SinglePointSolver
+
+
+def stalled_games(count, rows=5, cols=5, num_mines=5, seed=0):
+    """Small seeded games on which the deterministic solver gets stuck."""
+    rng = random.Random(seed)
+    games = []
+    while len(games) < count:
+        game = MinesweeperGame(rows, cols, num_mines, seed=rng.getrandbits(32))
+        game.reveal(rng.randrange(rows), rng.randrange(cols))
+        solver = SinglePointSolver(game)
+        if not solver.solve() and not game.lost:
+            games.append((game, solver))
+    return games
+
+
+def brute_force(game):
+    """Mine probability of every unknown cell, by trying every placement."""
+    unknown = [idx for idx in game.indices() if not game.revealed[idx] and not game.flags[idx]]
+    numbers = [idx for idx in game.revealed_indices()]
+    counts = dict.fromkeys(unknown, 0)
+    solutions = 0
+    for mines in itertools.combinations(unknown, game.mines_remaining):
+        mines = set(mines)
+        if all(game.board[idx] - game.flagged_neighbors[idx] ==
+               sum(idx + offset in mines for offset in game.offsets) for idx in numbers):
+            solutions += 1
+            for idx in mines:
+                counts[idx] += 1
+    return {idx: Fraction(count, solutions) for idx, count in counts.items()}
+
+
+@pytest.mark.parametrize('game, solver', stalled_games(40))
+def test_probabilities_match_brute_force(game, solver):
+    constraints = solver.frontier_constraints()
+    frontier_cells = set().union(*(unknown for unknown, _ in constraints.values()))
+    other_cells = game.unrevealed_count - len(frontier_cells)
+
+    probabilities, other_probability = mine_probabilities(
+        constraints, game.mines_remaining, other_cells)
+
+    expected = brute_force(game)
+    for idx, probability in expected.items():
+        assert probabilities.get(idx, other_probability) == probability
+
+
+def test_solver_flags_are_mines():
+    for game, _ in stalled_games(20, seed=1):
+        assert all(game.board[idx] == MINE_VALUE for idx in game.indices() if game.flags[idx])